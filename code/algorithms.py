@@ -1,19 +1,43 @@
-import copy
+import heapq
 import sys
 import time
-import math
+import functools
+import multiprocessing
 import numpy as np
-import copy as cp
+from concurrent.futures import ProcessPoolExecutor
 from code.functions import Operations
-from code.schedulingelements import Container
+from code.schedulingelements import Container, CumulativeLoad, EventQueue, GangContainer, HoleStore, JobOutcomes
+from code.schedulingelements import JobStream, MachineGroups, MachinePool
 
 
 class Algorithm:
-    def __init__(self, algorithm_id, jobs, machines, trial=False):
-        # algorithm class variables - jobs, which hold submitted jobs
+    def __init__(self, algorithm_id, jobs, machines, trial=False, metrics_only=False, backfill=False,
+                 preemptive=False):
+        # algorithm class variables - jobs, which hold submitted jobs as rows of a job table
         # machines, hold machines in their initial state, where all are available at time 0
-        self.__jobs = jobs
-        self.__machines = machines
+        # machines are either a list of machines or machine groups, where only available times are kept
+        # in metrics only mode, just the results and the machine available times are kept, so a list of machines is
+        # replaced by machine groups. preemptive algorithms move containers between machines and keep the list
+        if metrics_only and not preemptive and not isinstance(machines, MachineGroups):
+            machines = MachineGroups(len(machines))
+        self.__metrics_only = metrics_only
+        # backfill algorithms need the idle slots in front of jobs, even if machines do not hold containers
+        self.__backfill = backfill
+        # preemptive algorithms change the containers on single machines, so each core needs a container of its own
+        self.__preemptive = preemptive
+        self.__job_table = jobs
+        self.__jobs = JobStream(jobs.get_release_order())
+        # events of the simulation, jobs are released from the job stream once the simulation is prepared
+        self.__events = EventQueue()
+        self.__grouped_machines = isinstance(machines, MachineGroups)
+        self.__machines = machines if self.__grouped_machines else MachinePool(machines)
+
+        # each job is referred to by its row in the job table, job properties are read from the table columns
+        self.__job_ids = jobs.get_job_ids()
+        self.__processing_times = memoryview(jobs.get_processing_times())
+        self.__release_times = memoryview(jobs.get_release_times())
+        self.__due_times = memoryview(jobs.get_due_times())
+        self.__job_cores = memoryview(jobs.get_job_cores())
 
         # id holds the unique identifier for a particular algorithm
         self.__id = algorithm_id
@@ -28,34 +52,58 @@ class Algorithm:
 
         # container id variable
         self.__container_id = 1
-        # list of containers which are deployed. each container holds a single job
+        # list of containers which are deployed. each container holds a single job, on all of its cores
         self.__containers = []
         # list of open containers - used based on type of algorithm
-        self.__open_containers = []
-        # list of accepted and rejected jobs
+        self.__open_containers = HoleStore()
+        # start time, completion time and weight of each job, as scheduled by this algorithm
+        # metrics only simulations write no job logs, so the outcomes are not kept
+        self.__outcomes = JobOutcomes(len(jobs)) if not metrics_only else None
+        # list of accepted and rejected jobs, metrics only simulations just count them
         self.__accepted_jobs = []
         self.__rejected_jobs = []
+        self.__accepted_job_num = 0
+        self.__rejected_job_num = 0
         # total load, number of cores * processing time of a job
         self.__accepted_load = 0
         self.__rejected_load = 0
         # it is either the total submitted load or number of cores * makespan
         self.__optimal_load = 0
 
-        self.__trial_mode = trial
+        # metrics only simulations never write logs
+        self.__trial_mode = trial or metrics_only
 
     # Get methods to access private class variables
-    def get_job_list(self):
-        return self.__jobs
+    def get_job_table(self):
+        return self.__job_table
+
+    def get_event_queue(self):
+        return self.__events
+
+    def get_job_id(self, job):
+        return str(self.__job_ids[job])
 
-    def get_job_fifo(self):
-        return self.__jobs.pop(0)
+    def get_processing_time(self, job):
+        return self.__processing_times[job]
 
-    def read_job_fifo(self):
-        return self.__jobs[0]
+    def get_release_time(self, job):
+        return self.__release_times[job]
+
+    def get_due_time(self, job):
+        return self.__due_times[job]
+
+    def get_job_core(self, job):
+        return self.__job_cores[job]
 
     def get_machine_list(self):
+        return self.__machines.get_machines()
+
+    def get_machine_pool(self):
         return self.__machines
 
+    def get_machine(self, core):
+        return self.__machines.get_machine(core)
+
     def get_machine_num(self):
         return self.__machine_num
 
@@ -65,8 +113,10 @@ class Algorithm:
     def get_rejected_jobs(self):
         return self.__rejected_jobs
 
-    def get_open_containers(self):
-        return self.__open_containers
+    # time at which all machines have completed their jobs
+    def get_makespan(self):
+        self.__machines.sort()
+        return self.__machines.get_available_time(0)
 
     def get_container_id(self):
         id = self.__container_id
@@ -75,24 +125,38 @@ class Algorithm:
 
     # Update methods to modify private class variables
     def update_machine(self, core, container, completion_time):
-        self.__machines[core].update(container, completion_time)
+        self.__machines.update(core, container, completion_time)
+
+    def update_machine_window(self, start_core, containers, completion_time):
+        self.__machines.update_window(start_core, containers, completion_time)
 
     def update_container_list(self, container):
         self.__containers.append(container)
 
     def update_open_container_list_add(self, container):
-        self.__open_containers.append(container)
+        self.__open_containers.add(container)
+        self.__events.add(container.get_end_time(), EventQueue.HOLE_EXPIRY, container)
 
-    def update_open_container_list_pop(self, index):
-        self.__open_containers.pop(index)
+    def update_job(self, job, start_time, completion_time, weight=0):
+        if self.__outcomes is not None:
+            self.__outcomes.update(job, start_time, completion_time, weight)
+        self.__events.add(completion_time, EventQueue.COMPLETION, job)
 
     def update_accepted(self, job):
-        self.__accepted_jobs.append(job)
-        self.__accepted_load += job.get_job_core() * job.get_processing_time()
+        self.__add_accepted_job(job)
+        self.__accepted_load += self.__job_cores[job] * self.__processing_times[job]
 
     def update_rejected(self, job):
-        self.__rejected_jobs.append(job)
-        self.__rejected_load += job.get_job_core() * job.get_processing_time()
+        if not self.__metrics_only:
+            self.__rejected_jobs.append(job)
+        self.__rejected_job_num += 1
+        self.__rejected_load += self.__job_cores[job] * self.__processing_times[job]
+
+    # accepted jobs are only listed, if the simulation is not metrics only
+    def __add_accepted_job(self, job):
+        if not self.__metrics_only:
+            self.__accepted_jobs.append(job)
+        self.__accepted_job_num += 1
 
     def update_execution_time(self, execution_time):
         self.__execution_time = execution_time
@@ -102,159 +166,132 @@ class Algorithm:
         start_time = self._get_start_time(job, start_core)
         # completion time on this core
         completion_time = self._get_completion_time(job, start_core)
-        for core in range(start_core, start_core + job.get_job_core()):
-            # storing initial machine available time for idle containers
-            machine_available_time = self._get_machine_avail_time(core)
-            # get machine id
-            machine_id = self.get_machine_list()[core].get_machine_id()
-            # generating container and assigning job to this container
-            container = Container(self.__container_id)
-            container.assign(job, start_time, completion_time, machine_id)
-            # updating machine with this container
-            self.update_machine(core, container, completion_time)
-            # updating master container list
-            self.update_container_list(container)
-            # incrementing container number by 1
-            self.__container_id += 1
-            # only if the current job creates an idle slot on this machine, do
-            if start_time - machine_available_time > 0:
-                container = Container(self.__container_id)
-                container.reserve(machine_available_time, start_time, start_time - machine_available_time, machine_id)
-                self.update_open_container_list_add(container)
-                self.__container_id += 1
-
+        job_core = self.__job_cores[job]
+        # machine groups do not hold containers, only the available times are updated
+        if self.__grouped_machines:
+            # idle slots in front of the job are only kept for backfilling, they belong to no particular machine
+            if self.__backfill:
+                self.__add_idle_containers(start_time, self.__machines.get_available_times(start_core, job_core),
+                                           None)
+            self.__machines.update_window(start_core, job_core, completion_time)
+            self.update_job(job, start_time, completion_time)
+            self.update_accepted(job)
+            return
+        # storing initial machine available times for idle containers
+        machine_available_times = self.__machines.get_available_times(start_core, job_core)
+        machine_ids = self.__machines.get_machine_ids(start_core, job_core)
+        # a single gang container holds the job on all of its cores
+        gang = GangContainer(self.__container_id, job_core)
+        gang.assign(self.get_job_id(job), start_time, completion_time, machine_ids)
+        self.__container_id += job_core
+        # updating master container list
+        self.update_container_list(gang)
+        self.__add_idle_containers(start_time, machine_available_times, machine_ids)
+
+        # updating all cores of the job at once, preemptive algorithms get a container for each core
+        if self.__preemptive:
+            self.update_machine_window(start_core, gang.get_containers(), completion_time)
+        else:
+            self.__machines.update_gang(start_core, gang, completion_time)
         # updating job with start time and completion time
-        job.update(start_time, completion_time)
+        self.update_job(job, start_time, completion_time)
         # updating the accepted jobs list
         self.update_accepted(job)
 
+    # opens the idle slots in front of a job starting at start time, on the machines with the given available times
+    # machines which are available at the same time share one gang container for their idle slots
+    def __add_idle_containers(self, start_time, machine_available_times, machine_ids):
+        run_starts = np.flatnonzero(np.diff(machine_available_times)) + 1
+        run_starts = [0] + run_starts.tolist()
+        run_ends = run_starts[1:] + [len(machine_available_times)]
+        for run_start, run_end in zip(run_starts, run_ends):
+            machine_available_time = int(machine_available_times[run_start])
+            # only if the job creates an idle slot on these machines, do
+            if start_time - machine_available_time > 0:
+                gang = GangContainer(self.__container_id, run_end - run_start)
+                gang.reserve(machine_available_time, start_time, start_time - machine_available_time,
+                             machine_ids[run_start:run_end] if machine_ids is not None else None)
+                self.update_open_container_list_add(gang)
+                self.__container_id += run_end - run_start
+
     def check_and_allocate_backfill(self, job):
-        # if there are no open containers yet, simply return false
-        if len(self.__open_containers) <= 0:
-            # print('No open containers yet.')
-            return False
         # get the job properties
-        job_release_time = job.get_release_time()
-        job_due_time = job.get_due_time()
-        job_processing_time = job.get_processing_time()
-        job_core = job.get_job_core()
-
-        # create a binary matrix with eligible open containers
-        container_bin_matrix = []
-        # collect machines ids to which each container belongs
-        container_machine_ids = []
-        # for every container in the list of open containers, do
-        for container in self.__open_containers:
-            # time at which container becomes available
-            container_start_time = container.get_start_time()
-            # time after which the container is no longer available
-            container_end_time = container.get_end_time()
-            # usable length within the container w.r.t. our job
-            usable_length = min(job_due_time, container_end_time) - max(job_release_time, container_start_time)
+        job_release_time = self.__release_times[job]
+        job_due_time = self.__due_times[job]
+        job_processing_time = self.__processing_times[job]
+        job_core = self.__job_cores[job]
+
+        # collect eligible open containers, with the part of each container which lies between job release and due
+        eligible_containers = []
+        window_start_times = []
+        window_end_times = []
+        # for every open container overlapping the period between job release and due, do
+        for hole in self.__open_containers.get_holes(job_release_time, job_due_time):
+            # usable part of the container w.r.t. our job
+            window_start_time = max(job_release_time, hole.get_start_time())
+            window_end_time = min(job_due_time, hole.get_end_time())
             # if we have enough space inside the container, do
-            if usable_length >= job_processing_time:
-                # first column is a reference to the container
-                container_id = np.array([container.get_id()])
-                # collect machine id
-                container_machine_ids.append(container.get_machine())
-                # each row is divided into three blocks
-                # start block is vacant area from job release till container start, filled with zeros
-                start_block = np.zeros(max(job_release_time, container_start_time) - job_release_time)
-                # start block is vacant area from container end till job due, filled with zeros
-                end_block = np.zeros(job_due_time - min(job_due_time, container_end_time))
-                # mid block is the usable length of the container, filled with ones
-                mid_block = np.ones(usable_length)
-                # the appended row for the particular container
-                container_bin_matrix.append(np.hstack((container_id, start_block, mid_block, end_block)))
+            if window_end_time - window_start_time >= job_processing_time:
+                # idle slots shared by several machines are split up, once the job may be backfilled into them
+                containers = self.__open_containers.expand(hole) if isinstance(hole, GangContainer) else [hole]
+                eligible_containers.extend(containers)
+                window_start_times.extend([window_start_time] * len(containers))
+                window_end_times.extend([window_end_time] * len(containers))
 
         # if not even one container exists, where enough job length is available, then return false
-        # else if containers are available partially, check for enough machines which are free
-        free_machines = []
-        if len(container_bin_matrix) <= 0:
+        # a job without processing time is never backfilled
+        if len(eligible_containers) <= 0 or job_processing_time <= 0:
             # print('Not even one open container exists, which has free space equivalent to the job length.')
             return False
 
-        # this matrix sums up the rows vertically. if this value is larger than or equal to the job core requirement,
-        # then we know that there are enough free containers at this point which meet the core requirement
-        container_overlap_matrix = np.sum(container_bin_matrix, axis=0)
-
         # now we need to check whether there are enough overlapping containers to schedule our job
-        start_point = None
-        job_length = 0
-        for position, value in enumerate(container_overlap_matrix):
-            # we ignore the container id at this point
-            if position == 0:
-                continue
-            # if we have enough containers, we take the current point as start point
-            if value >= job_core:
-                if start_point is None:
-                    start_point = position
-                job_length += 1
-            else:
-                # before covering the job length, if number drops - then we need to look for a new point
-                start_point = None
-                job_length = 0
-            # if we found continuous job length in containers, then we are done
-            if job_length == job_processing_time:
-                break
-
-        if start_point is None or job_length < job_processing_time:
+        job_start_time = self._search_backfill_start_time(window_start_times, window_end_times,
+                                                          job_core, job_processing_time)
+        if job_start_time is None:
             # print('Not enough containers to meet the core requirement of the job.')
             return False
+        job_end_time = job_start_time + job_processing_time
 
         # variable to keep count of how many containers we already assigned
         assigned_containers = 0
-        # variable hold the container ids in the current order of open containers
-        container_ids = np.array([container.get_id() for container in self.__open_containers])
-        # variable to hold containers, to which job has been allocated
-        allocated_containers = []
+        # variable to hold machines, to which job has been allocated
+        allocated_machines = []
         # variable holds new open containers, which might have been created because of job allocation
         open_containers_new = []
-        # reference to original open container list, which need to be deleted because of new allocation
-        delete_ids = []
+        # open containers, which need to be deleted because of new allocation
+        delete_containers = []
 
-        # go through each row of container binary matrix and allocate containers one by one
-        for row in container_bin_matrix:
+        # go through each eligible container and allocate containers one by one
+        for open_container, window_start_time, window_end_time in zip(eligible_containers, window_start_times,
+                                                                      window_end_times):
             # if enough job length is available in this container, then allocate job
-            if row[start_point] == 1 and row[start_point + job_processing_time - 1] == 1:
-                # get the container id
-                container_id = row[0]
-                # add container id to delete list
-                delete_ids.append(container_id)
-
-                # find the location of the container in the original list
-                index_array = np.where(container_ids == container_id)
-                index = index_array[0][0]
-                # start and end times of the job, if assigned to this container
-                job_start_time = job_release_time + start_point - 1
-                job_end_time = job_start_time + job_processing_time
-                machine_id = self.__open_containers[index].get_machine()
-                # create a new container and assign to allocated list
-                container = Container(self.__container_id)
-                container.assign(job, job_start_time, job_end_time, machine_id)
-                allocated_containers.append(container)
-                self.__container_id += 1
+            if window_start_time <= job_start_time and job_end_time <= window_end_time:
+                # add container to delete list
+                delete_containers.append(open_container)
+
+                # assign the machine of the container to the allocated list
+                allocated_machines.append(open_container.get_machine())
 
                 # if container is not fully utilized, there will still be idle slots
                 # creating new open container, if idle slot precedes the allocated slot
-                if job_start_time > self.__open_containers[index].get_start_time():
+                if job_start_time > open_container.get_start_time():
                     container = Container(self.__container_id)
                     # the container lies between earlier container start time and actual job start time
-                    container.reserve(self.__open_containers[index].get_start_time(),
+                    container.reserve(open_container.get_start_time(),
                                       job_start_time,
-                                      job_start_time - self.__open_containers[index].get_start_time(),
-                                      self.__open_containers[index].get_machine())
+                                      job_start_time - open_container.get_start_time(),
+                                      open_container.get_machine())
                     open_containers_new.append(container)
                     self.__container_id += 1
 
                 # creating new open container, if idle slot follows the allocated slot
-                if job_end_time < self.__open_containers[index].get_end_time():
+                if job_end_time < open_container.get_end_time():
                     container = Container(self.__container_id)
                     # the container lies between actual job end time and earlier container end time
                     container.reserve(job_end_time,
-                                      self.__open_containers[index].get_end_time(),
-                                      self.__open_containers[index].get_end_time() - job_end_time,
-                                      self.__open_containers[index].get_machine())
+                                      open_container.get_end_time(),
+                                      open_container.get_end_time() - job_end_time,
+                                      open_container.get_machine())
                     open_containers_new.append(container)
                     self.__container_id += 1
 
@@ -262,108 +299,134 @@ class Algorithm:
 
                 # if enough containers are assigned for the job, then exit
                 if assigned_containers == job_core:
-                    job.update(job_start_time, job_end_time)
-                    self.__accepted_jobs.append(job)
+                    self.update_job(job, job_start_time, job_end_time)
+                    self.__add_accepted_job(job)
                     break
 
-        _, indices, _ = np.intersect1d(container_ids, delete_ids, return_indices=True)
-        indices = np.sort(indices)
-        while len(indices) > 0:
-            index = indices[-1]
-            self.__open_containers.pop(index)
-            indices = np.delete(indices, -1)
+        for container in delete_containers:
+            self.__open_containers.remove(container)
 
         for container in open_containers_new:
-            self.__open_containers.append(cp.deepcopy(container))
-
-        machine_ids = np.array([machine.get_machine_id() for machine in self.__machines])
-        while len(allocated_containers) > 0:
-            container = allocated_containers.pop(0)
-            machine_id = container.get_machine()
-            index_array = np.where(machine_ids == machine_id)
-            index = index_array[0][0]
-            self.__machines[index].attach(container)
+            self.update_open_container_list_add(container)
+
+        # machine groups do not hold containers, the backfilled job leaves their available times as they are
+        # otherwise a single gang container holds the job on all allocated machines
+        if not self.__grouped_machines:
+            gang = GangContainer(self.__container_id, len(allocated_machines))
+            gang.assign(self.get_job_id(job), job_start_time, job_end_time, np.array(allocated_machines,
+                                                                                     dtype=np.int64))
+            self.__container_id += len(allocated_machines)
+            for machine_id in allocated_machines:
+                self.__machines.get_machine_by_id(machine_id).attach(gang)
 
         self.update_accepted(job)
         return True
 
+    # sweep over the start and end times of the usable container windows to find the earliest time
+    # from which at least job core windows overlap for the whole processing time
+    # returns None, if there is no such time
+    @staticmethod
+    def _search_backfill_start_time(window_start_times, window_end_times, job_core, processing_time):
+        window_num = len(window_start_times)
+        times, time_indices = np.unique(np.concatenate((window_start_times, window_end_times)), return_inverse=True)
+        changes = np.zeros(len(times), dtype=np.int64)
+        np.add.at(changes, time_indices, np.concatenate((np.ones(window_num, dtype=np.int64),
+                                                         -np.ones(window_num, dtype=np.int64))))
+        # number of overlapping windows from each time until the next one, the last one is always zero
+        overlaps = np.cumsum(changes)
+        enough = overlaps >= job_core
+        # periods where enough windows overlap, each period ends at a time with too few overlaps
+        period_starts = np.flatnonzero(enough & ~np.concatenate(([False], enough[:-1])))
+        period_ends = np.flatnonzero(~enough & np.concatenate(([False], enough[:-1])))
+        long_periods = np.flatnonzero(times[period_ends] - times[period_starts] >= processing_time)
+        if len(long_periods) <= 0:
+            return None
+        return int(times[period_starts[long_periods[0]]])
+
+    # method to run the simulation, jobs are scheduled one by one in order of their release times
+    def execute(self, trial=False):
+        # start time point reference
+        simulation_start_time = time.time()
+        # sort all jobs in ascending order and set up the algorithm
+        self.prepare()
+        # every job is scheduled, when it is released
+        self.__events.dispatch()
+        # end time point reference
+        simulation_end_time = time.time()
+        execution_time = round(simulation_end_time - simulation_start_time, 4)
+        # updating the run time logs and returning the result of the simulation
+        return self.complete(execution_time)
+
+    # method to set up the algorithm before the first job is scheduled
+    def prepare(self):
+        self._sort_jobs_ascending_release_time()
+        # released jobs are handed over to the algorithm one by one
+        self.__events = EventQueue(self.__jobs, self.__release_times)
+        self.__events.subscribe(EventQueue.RELEASE, self.schedule_job)
+
+    # method to schedule a single job, the jobs are handed over in order of their release times
+    def schedule_job(self, job):
+        raise NotImplementedError('{} does not schedule jobs one by one'.format(self.__id))
+
+    # method to complete the simulation once all jobs are scheduled, returns its results
+    def complete(self, execution_time):
+        self.update_execution_time(execution_time)
+        # updating the run time logs
+        self._update_logs()
+        # returning the result of the simulation
+        return self._results()
+
     # Returns result in a list form
     # n_accepted jobs, n_rejected_jobs, accepted load, rejected load, optimal load
     def _results(self):
-        self.__machines.sort(key=lambda m: m.get_available_time(), reverse=True)
-        makespan = self.__machines[0].get_available_time()
+        makespan = self.get_makespan()
         total_resources = len(self.__machines) * makespan
         total_load = self.__accepted_load + self.__rejected_load
         self.__optimal_load = min(total_resources, total_load)
-        return ([len(self.__accepted_jobs), len(self.__rejected_jobs),
+        return ([self.__accepted_job_num, self.__rejected_job_num,
                  self.__accepted_load, self.__rejected_load, self.__optimal_load, self.__execution_time])
 
     # method to sort jobs in ascending order of their release times
     def _sort_jobs_ascending_release_time(self):
-        self.__jobs.sort(key=lambda j: j.get_release_time())
+        self.__jobs = JobStream(self.__job_table.get_release_order())
 
     # method to sort machines so that most loaded stays on top and least loaded at the bottom
     def _sort_machines_descending_avail_time(self):
-        self.__machines.sort(key=lambda m: m.get_available_time(), reverse=True)
+        self.__machines.sort()
 
     # method to return start time of a particular job on a particular machine
     def _get_start_time(self, job, core):
-        release_time = job.get_release_time()
-        machine_avail_time = self.__machines[core].get_available_time()
+        release_time = self.__release_times[job]
+        machine_avail_time = self.__machines.get_available_time(core)
 
         start_time = max(machine_avail_time, release_time)
         return start_time
 
     # this method returns machine available time
     def _get_machine_avail_time(self, core):
-        machine_avail_time = self.__machines[core].get_available_time()
+        machine_avail_time = self.__machines.get_available_time(core)
         return machine_avail_time
 
     # this method returns machine reference time
     def _get_machine_reference_time(self, core):
-        machine_reference_time = self.__machines[core].get_reference_time()
+        machine_reference_time = self.__machines.get_machine(core).get_reference_time()
         return machine_reference_time
 
     # method to return completion time of a job on a particular machine
     def _get_completion_time(self, job, core):
-        release_time = job.get_release_time()
-        processing_time = job.get_processing_time()
-        machine_avail_time = self.__machines[core].get_available_time()
+        release_time = self.__release_times[job]
+        processing_time = self.__processing_times[job]
+        machine_avail_time = self.__machines.get_available_time(core)
 
         completion_time = max(machine_avail_time, release_time) + processing_time
         return completion_time
 
     # logarithmic search method to find the index of the most loaded machine, where job can be completed legally
+    # the job is known to be feasible on the least loaded machines, so the most loaded window of c cores
+    # which are all available at the latest start time of the job is used
     def _search_loaded_machine(self, job):
-        # If the job can be scheduled legally on the most loaded machine, then we go ahead with it
-        if self._get_completion_time(job, 0) <= job.get_due_time():
-            return 0
-        else:
-            # We use logarithmic search to arrive at the number of machines
-            m_upper = 0
-            m_lower = self.__machine_num - 1
-
-            # if both are the same, then we only have one machine
-            if m_upper == m_lower:
-                return m_upper
-
-            # if there are more than one machine, then we search for the most loaded one
-            count = 0
-            while m_upper != m_lower:
-                m = math.ceil((m_upper + m_lower) / 2)
-                # there are only 2 machines. if first machine was capable of hosting the job, initial check
-                # returned 0. so we return the second machine
-                if m == m_lower:
-                    return m_lower
-
-                # in case of more than 2 machines, we keep shifting limits
-                if self._get_completion_time(job, m) <= job.get_due_time():
-                    m_lower = m
-                else:
-                    m_upper = m
-
-            # upon both limits converging, we return the machine index
-            return m_lower
+        latest_start_time = self.__due_times[job] - self.__processing_times[job]
+        return self.__machines.search_window(self.__job_cores[job], latest_start_time)
 
     # method to update
 
@@ -373,8 +436,13 @@ class Algorithm:
             self.__operations.update_system_log(self.__id, self.__job_num, self.__machine_num, self.__execution_time)
             self.__operations.update_time_log(self.__id, self.__job_num, self.__machine_num, self.__execution_time)
             self.__operations.update_algorithm_log(self.__id, self.__job_num, self.__machine_num, self.__execution_time)
-            self.__operations.update_machine_log(self.__id, self.__machines)
-            self.__operations.update_job_log(self.__id, self.__accepted_jobs, self.__rejected_jobs)
+            self.__operations.update_machine_log(self.__id, self.__machines.get_machines())
+            job_stats = [self.__job_table.get_stat(job,
+                                                   self.__outcomes.get_start_time(job),
+                                                   self.__outcomes.get_completion_time(job),
+                                                   self.__outcomes.get_weight(job))
+                         for job in self.__accepted_jobs + self.__rejected_jobs]
+            self.__operations.update_job_log(self.__id, job_stats)
 
 
 class AlgorithmGBalanced(Algorithm):
@@ -385,45 +453,29 @@ class AlgorithmGBalanced(Algorithm):
         in case of multicore jobs, we only consider machines {1, ..., m - core + 1} to check feasibility.
     """
 
-    def __init__(self, jobs, machines):
-        super().__init__('greedybalanced', jobs, machines)
-
-    def execute(self, trial=False):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().get_job_fifo()
-            # sort machines based on reverse order of remaining load
-            super()._sort_machines_descending_avail_time()
-            # check whether the job has enough cores to complete
-            # considering multi-core jobs, last core for job c = m - job_core
-            legal_completion_status = self.__check_legal_completion(job)
-            if not legal_completion_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            acceptance_status = self.__check_acceptance_status(job)
-            if not acceptance_status:
-                continue
-            # allocate job based on greedy balanced allocation policy
-            self.__allocate_greedy_balanced(job)
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
+    def __init__(self, jobs, machines, metrics_only=False):
+        super().__init__('greedybalanced', jobs, machines, metrics_only=metrics_only)
+
+    def schedule_job(self, job):
+        # sort machines based on reverse order of remaining load
+        super()._sort_machines_descending_avail_time()
+        # check whether the job has enough cores to complete
+        # considering multi-core jobs, last core for job c = m - job_core
+        legal_completion_status = self.__check_legal_completion(job)
+        if not legal_completion_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        acceptance_status = self.__check_acceptance_status(job)
+        if not acceptance_status:
+            return
+        # allocate job based on greedy balanced allocation policy
+        self.__allocate_greedy_balanced(job)
 
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -433,9 +485,9 @@ class AlgorithmGBalanced(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -443,7 +495,7 @@ class AlgorithmGBalanced(Algorithm):
 
     def __allocate_greedy_balanced(self, job):
         # getting starting core of the job
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         # allocate job to machine using super method
         super().allocate_job_to_core(job, start_core)
 
@@ -456,45 +508,29 @@ class AlgorithmGBestFit(Algorithm):
         in case of multicore jobs, we only consider machines {1, ..., m - core + 1} to check feasibility.
     """
 
-    def __init__(self, jobs, machines):
-        super().__init__('greedybestfit', jobs, machines)
-
-    def execute(self, trial=False):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().get_job_fifo()
-            # sort machines based on reverse order of remaining load
-            super()._sort_machines_descending_avail_time()
-            # check whether the job has enough cores to complete
-            # considering multi-core jobs, last core for job c = m - job_core
-            legal_completion_status = self.__check_legal_completion(job)
-            if not legal_completion_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            acceptance_status = self.__check_acceptance_status(job)
-            if not acceptance_status:
-                continue
-            # allocate job based on greedy balanced allocation policy
-            self.__allocate_greedy_bestfit(job)
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
+    def __init__(self, jobs, machines, metrics_only=False):
+        super().__init__('greedybestfit', jobs, machines, metrics_only=metrics_only)
+
+    def schedule_job(self, job):
+        # sort machines based on reverse order of remaining load
+        super()._sort_machines_descending_avail_time()
+        # check whether the job has enough cores to complete
+        # considering multi-core jobs, last core for job c = m - job_core
+        legal_completion_status = self.__check_legal_completion(job)
+        if not legal_completion_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        acceptance_status = self.__check_acceptance_status(job)
+        if not acceptance_status:
+            return
+        # allocate job based on greedy balanced allocation policy
+        self.__allocate_greedy_bestfit(job)
 
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -504,9 +540,9 @@ class AlgorithmGBestFit(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -530,92 +566,88 @@ class AlgorithmThreshold(Algorithm):
         in case of multicore jobs, we only consider machines {1, ..., m - core + 1} to check feasibility.
     """
 
-    def __init__(self, jobs, machines, epsilon):
-        super().__init__('threshold', jobs, machines)
+    def __init__(self, jobs, machines, epsilon, metrics_only=False):
+        super().__init__('threshold', jobs, machines, metrics_only=metrics_only)
         self.__epsilon = epsilon
+        self.__f_values = None
 
-    def execute(self):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
+    def prepare(self):
+        super().prepare()
         # calculate f values for the machine system
-        f_values = self.__calculate_f_values_epsilon()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().get_job_fifo()
-            # sort machines based on reverse order of remaining load
-            super()._sort_machines_descending_avail_time()
-            # check whether the job has enough cores to complete
-            # considering multi-core jobs, last core for job c = m - job_core
-            legal_completion_status = self.__check_legal_completion(job)
-            if not legal_completion_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            deadline_threshold_acceptance_status = self.__check_deadline_threshold_acceptance_status(f_values, job)
-            if not deadline_threshold_acceptance_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            acceptance_status = self.__check_acceptance_status(job)
-            if not acceptance_status:
-                continue
-            # allocate job based on greedy balanced allocation policy
-            self.__allocate_greedy_bestfit(job)
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
-
-    def __calculate_f_value_limits(self):
-        machine_num = super().get_machine_num()
-        f_eps_m_k = np.zeros((machine_num + 1, machine_num + 1))
+        self.__f_values = AlgorithmThreshold.get_f_values(super().get_machine_num(), self.__epsilon)
+
+    def schedule_job(self, job):
+        # sort machines based on reverse order of remaining load
+        super()._sort_machines_descending_avail_time()
+        # check whether the job has enough cores to complete
+        # considering multi-core jobs, last core for job c = m - job_core
+        legal_completion_status = self.__check_legal_completion(job)
+        if not legal_completion_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        deadline_threshold_acceptance_status = self.__check_deadline_threshold_acceptance_status(self.__f_values, job)
+        if not deadline_threshold_acceptance_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        acceptance_status = self.__check_acceptance_status(job)
+        if not acceptance_status:
+            return
+        # allocate job based on greedy balanced allocation policy
+        self.__allocate_greedy_bestfit(job)
+
+    # f values depend only on the number of machines and epsilon
+    # they are kept in memory for recent settings and on disk for all settings calculated so far
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def get_f_values(machine_num, epsilon):
+        operations = Operations()
+        f_values = operations.read_f_values(machine_num, epsilon)
+        if f_values is None:
+            f_values = AlgorithmThreshold.__calculate_f_values_epsilon(machine_num, epsilon)
+            if f_values is None:
+                return None
+            operations.update_f_values(machine_num, epsilon, f_values)
+        f_values.setflags(write=False)
+        return f_values
+
+    @staticmethod
+    def __calculate_f_value_limits(machine_num):
         f_eps_m_k_limits = np.zeros((machine_num, 2))
 
-        for m in range(1, machine_num):
-            k = machine_num - m
-            f_eps_m_k[m, k] = 2.0
-            left_value = (machine_num * f_eps_m_k[m, k] + 1) / k
-
-            for q in range(k + 1, machine_num + 1):
-                denominator = k
-                for h in range(k, q):
-                    denominator = denominator + f_eps_m_k[m, h] - 1
-                f_eps_m_k[m, q] = (left_value * denominator - 1) / machine_num
-                f_eps_m_k_limits[m - 1, 0] = f_eps_m_k[m, k]
-                f_eps_m_k_limits[m - 1, 1] = f_eps_m_k[m, q]
-                break
+        # for each m, f value at k = machine_num - m is 2 and the next f value follows from the recurrence
+        # all values of m are calculated at once
+        k = machine_num - np.arange(1, machine_num)
+        left_value = (machine_num * 2.0 + 1) / k
+        denominator = k + 2.0 - 1
+        f_eps_m_k_limits[:machine_num - 1, 0] = 2.0
+        f_eps_m_k_limits[:machine_num - 1, 1] = (left_value * denominator - 1) / machine_num
 
         f_eps_m_k_limits[machine_num - 1, 0] = 2.0
         f_eps_m_k_limits[machine_num - 1, 1] = 5.0
         # This function returns the f_value matrix
         return f_eps_m_k_limits
 
-    def __calculate_eps_value(self, k, f_value):
-        machine_num = super().get_machine_num()
-        f_eps_m_k = np.zeros(machine_num + 1)
+    @staticmethod
+    def __calculate_eps_value(machine_num, k, f_value):
+        f_eps_m_k = [0.0] * (machine_num + 1)
         f_eps_m_k[k] = f_value
         left_value = (machine_num * f_eps_m_k[k] + 1) / k
 
+        # the denominator is a running sum over the f values from k onwards
+        denominator = k
         for q in range(k + 1, machine_num + 1):
-            denominator = k
-            for h in range(k, q):
-                denominator = denominator + f_eps_m_k[h] - 1
+            denominator = denominator + f_eps_m_k[q - 1] - 1
             f_eps_m_k[q] = (left_value * denominator - 1) / machine_num
 
         epsilon_value = 1 / (f_eps_m_k[machine_num] - 1)
         f_eps_m_k[0] = epsilon_value
-        return f_eps_m_k
+        return np.array(f_eps_m_k)
 
-    def __calculate_f_values_epsilon(self):
-        machine_num = super().get_machine_num()
-        f_eps_m_k_limits = self.__calculate_f_value_limits()
+    @staticmethod
+    def __calculate_f_values_epsilon(machine_num, epsilon):
+        f_eps_m_k_limits = AlgorithmThreshold.__calculate_f_value_limits(machine_num)
         row, col = f_eps_m_k_limits.shape
         for i in range(0, row):
             f_value_i_lower_limit = f_eps_m_k_limits[i, 0]
@@ -623,53 +655,68 @@ class AlgorithmThreshold(Algorithm):
 
             k = machine_num - i
 
-            eps_value_i_lower_limit = self.__calculate_eps_value(k, f_value_i_lower_limit)
-            eps_value_i_upper_limit = self.__calculate_eps_value(k, f_value_i_upper_limit)
+            eps_value_i_lower_limit = AlgorithmThreshold.__calculate_eps_value(machine_num, k, f_value_i_lower_limit)
+            eps_value_i_upper_limit = AlgorithmThreshold.__calculate_eps_value(machine_num, k, f_value_i_upper_limit)
             eps_value_i_mid = []
 
             lower_eps_value = eps_value_i_upper_limit[0]
             upper_eps_value = eps_value_i_lower_limit[0]
             mid_eps_value = 99999
 
-            if lower_eps_value <= self.__epsilon <= upper_eps_value:
-                while mid_eps_value != self.__epsilon:
+            if lower_eps_value <= epsilon <= upper_eps_value:
+                while mid_eps_value != epsilon:
                     f_value_i_mid = (f_value_i_lower_limit + f_value_i_upper_limit) / 2
 
-                    eps_value_i_lower_limit = self.__calculate_eps_value(k, f_value_i_lower_limit)
-                    eps_value_i_upper_limit = self.__calculate_eps_value(k, f_value_i_upper_limit)
-                    eps_value_i_mid = self.__calculate_eps_value(k, f_value_i_mid)
+                    # the limits are earlier mid values, so only the new mid value is calculated
+                    eps_value_i_mid = AlgorithmThreshold.__calculate_eps_value(machine_num, k, f_value_i_mid)
 
                     lower_eps_value = eps_value_i_upper_limit[0]
                     upper_eps_value = eps_value_i_lower_limit[0]
                     mid_eps_value = eps_value_i_mid[0]
 
-                    if mid_eps_value >= self.__epsilon >= lower_eps_value:
+                    if mid_eps_value >= epsilon >= lower_eps_value:
                         f_value_i_lower_limit = f_value_i_mid
-                    elif mid_eps_value <= self.__epsilon <= upper_eps_value:
+                        eps_value_i_lower_limit = eps_value_i_mid
+                    elif mid_eps_value <= epsilon <= upper_eps_value:
                         f_value_i_upper_limit = f_value_i_mid
+                        eps_value_i_upper_limit = eps_value_i_mid
 
-                    if round(mid_eps_value, 13) == float(self.__epsilon):
+                    if round(mid_eps_value, 13) == float(epsilon):
                         break
 
                 return eps_value_i_mid
 
     def __calculate_deadline_threshold(self, f_values, job):
         # This function calculates the maximum deadline threshold
-        # First sort the machines in descending order
-        release_time = job.get_release_time()
-        # super()._sort_machines_descending_avail_time()
+        release_time = super().get_release_time(job)
+        # the most loaded machine alone gives a threshold of release time, if its f value is 0
+        # a machine available by release time gives at most release time, so only busy machines are needed then
+        if f_values[1] == 0:
+            busy_machine_num = super().get_machine_pool().search_loaded(release_time)
+            least_threshold = float(release_time)
+        else:
+            busy_machine_num = super().get_machine_num()
+            least_threshold = None
         # Calculate deadline threshold of individual machines
-        deadline_threshold_m = []
-        for m in range(0, super().get_machine_num()):
-            load_m = super().get_machine_list()[m].get_available_time() - release_time
-            deadline_threshold_m.append(release_time + load_m * f_values[m + 1])
+        # machines with equal available times are grouped, f values are non-decreasing in the machine index
+        # so the threshold of a group is largest on its last machine if it is loaded, else on its first machine
+        available_times, machine_counts = super().get_machine_pool().get_groups(busy_machine_num)
+        if len(available_times) <= 0:
+            return least_threshold
+        group_ends = np.cumsum(machine_counts)
+        load_m = available_times - release_time
+        f_values_m = np.where(load_m >= 0, f_values[group_ends], f_values[group_ends - machine_counts + 1])
+        deadline_threshold_m = release_time + load_m * f_values_m
         # Return the maximum value
-        return max(deadline_threshold_m)
+        deadline_threshold = np.max(deadline_threshold_m)
+        if least_threshold is not None:
+            deadline_threshold = max(deadline_threshold, least_threshold)
+        return deadline_threshold
 
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -680,7 +727,7 @@ class AlgorithmThreshold(Algorithm):
         # if due time is less than deadline threshold, reject the job
         # else, accept the job
         deadline_threshold = self.__calculate_deadline_threshold(f_values, job)
-        if job.get_due_time() < deadline_threshold:
+        if super().get_due_time(job) < deadline_threshold:
             super().update_rejected(job)
             return False
         else:
@@ -689,9 +736,9 @@ class AlgorithmThreshold(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -714,45 +761,29 @@ class AlgorithmGMinIdle(Algorithm):
         we select the cores, which are least blocked by this job and schedule the job.
         in case of multicore jobs, we only consider machines {1, ..., m - core + 1} to check feasibility.
     """
-    def __init__(self, jobs, machines):
-        super().__init__('greedyminidle', jobs, machines)
-
-    def execute(self, trial=False):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().get_job_fifo()
-            # sort machines based on reverse order of remaining load
-            super()._sort_machines_descending_avail_time()
-            # check whether the job has enough cores to complete
-            # considering multi-core jobs, last core for job c = m - job_core
-            legal_completion_status = self.__check_legal_completion(job)
-            if not legal_completion_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            acceptance_status = self.__check_acceptance_status(job)
-            if not acceptance_status:
-                continue
-            # allocate job based on greedy balanced allocation policy
-            self.__allocate_greedy_minidle(job)
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
+    def __init__(self, jobs, machines, metrics_only=False):
+        super().__init__('greedyminidle', jobs, machines, metrics_only=metrics_only)
+
+    def schedule_job(self, job):
+        # sort machines based on reverse order of remaining load
+        super()._sort_machines_descending_avail_time()
+        # check whether the job has enough cores to complete
+        # considering multi-core jobs, last core for job c = m - job_core
+        legal_completion_status = self.__check_legal_completion(job)
+        if not legal_completion_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        acceptance_status = self.__check_acceptance_status(job)
+        if not acceptance_status:
+            return
+        # allocate job based on greedy balanced allocation policy
+        self.__allocate_greedy_minidle(job)
 
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -762,9 +793,9 @@ class AlgorithmGMinIdle(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -772,37 +803,20 @@ class AlgorithmGMinIdle(Algorithm):
 
     def __allocate_greedy_minidle(self, job):
         # getting starting core of the job
-        last_core = super().get_machine_num() - job.get_job_core()
-        # reference variables for min idle execution
-        minimum_idle_time = None
-        minimum_idle_core = None
-        # we move from the least loaded core to most loaded core
-        for start_core in range(last_core, -1, -1):
-            # completion time on this core
-            completion_time = super()._get_completion_time(job, start_core)
-            # when it is no longer possible to execute a job on given core, we stop
-            if completion_time > job.get_due_time():
-                break
-            else:
-                # calculate start time on this core
-                start_time = super()._get_start_time(job, start_core)
-                # variable to calculate idle time
-                total_idle_time = 0
-                # go through all the cores
-                for core in range(start_core, start_core + job.get_job_core()):
-                    # update idle time
-                    total_idle_time += start_time - super().get_machine_list()[core].get_available_time()
-
-                # for the first machine, update the min idle variables as such
-                if minimum_idle_core is None:
-                    minimum_idle_time = total_idle_time
-                    minimum_idle_core = start_core
-
-                # for remaining executions, update only when a new min setting is found
-                # if there are multiple min settings, we use the machine which is most loaded
-                if minimum_idle_time >= total_idle_time:
-                    minimum_idle_time = total_idle_time
-                    minimum_idle_core = start_core
+        job_core = super().get_job_core(job)
+        last_core = super().get_machine_num() - job_core
+        # the job can be completed legally on every core from the first one available at its latest start time
+        latest_start_time = super().get_due_time(job) - super().get_processing_time(job)
+        first_core = super().get_machine_pool().search_loaded(latest_start_time)
+        # available times of all the cores of the candidate windows, with their prefix sums
+        available_times = super().get_machine_pool().get_available_times(first_core, last_core - first_core + job_core)
+        prefix_times = np.concatenate(([0], np.cumsum(available_times, dtype=np.int64)))
+        # the job starts on the most loaded core of a window, idle time is summed up over all the cores
+        start_times = np.maximum(available_times[:last_core - first_core + 1], super().get_release_time(job))
+        window_times = prefix_times[job_core:] - prefix_times[:last_core - first_core + 1]
+        total_idle_times = job_core * start_times - window_times
+        # if there are multiple min settings, we use the machine which is most loaded
+        minimum_idle_core = first_core + int(np.argmin(total_idle_times))
         # once we have our min idle core, we schedule jobs on min idle to min idle + c cores
         # allocate job to machine using super method
         super().allocate_job_to_core(job, minimum_idle_core)
@@ -816,49 +830,33 @@ class AlgorithmGBalancedBF(Algorithm):
         if not, then the traditional greedy balanced algorithm is followed.
     """
 
-    def __init__(self, jobs, machines):
-        super().__init__('greedybalancedbackfill', jobs, machines)
-
-    def execute(self, trial=False):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().get_job_fifo()
-            # check backfill possibility
-            backfill_status = super().check_and_allocate_backfill(job)
-            if backfill_status:
-                continue
-            # sort machines based on reverse order of remaining load
-            super()._sort_machines_descending_avail_time()
-            # check whether the job has enough cores to complete
-            # considering multi-core jobs, last core for job c = m - job_core
-            legal_completion_status = self.__check_legal_completion(job)
-            if not legal_completion_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            acceptance_status = self.__check_acceptance_status(job)
-            if not acceptance_status:
-                continue
-            # allocate job based on greedy balanced allocation policy
-            self.__allocate_greedy_balanced(job)
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
+    def __init__(self, jobs, machines, metrics_only=False):
+        super().__init__('greedybalancedbackfill', jobs, machines, metrics_only=metrics_only, backfill=True)
+
+    def schedule_job(self, job):
+        # check backfill possibility
+        backfill_status = super().check_and_allocate_backfill(job)
+        if backfill_status:
+            return
+        # sort machines based on reverse order of remaining load
+        super()._sort_machines_descending_avail_time()
+        # check whether the job has enough cores to complete
+        # considering multi-core jobs, last core for job c = m - job_core
+        legal_completion_status = self.__check_legal_completion(job)
+        if not legal_completion_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        acceptance_status = self.__check_acceptance_status(job)
+        if not acceptance_status:
+            return
+        # allocate job based on greedy balanced allocation policy
+        self.__allocate_greedy_balanced(job)
 
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -868,9 +866,9 @@ class AlgorithmGBalancedBF(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -878,7 +876,7 @@ class AlgorithmGBalancedBF(Algorithm):
 
     def __allocate_greedy_balanced(self, job):
         # getting starting core of the job
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         # allocate job to machine using super method
         super().allocate_job_to_core(job, start_core)
 
@@ -891,49 +889,33 @@ class AlgorithmGBestFitBF(Algorithm):
         if not, then the traditional greedy bestfit algorithm is followed.
     """
 
-    def __init__(self, jobs, machines):
-        super().__init__('greedybestfitbackfill', jobs, machines)
-
-    def execute(self, trial=False):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().get_job_fifo()
-            # check backfill possibility
-            backfill_status = super().check_and_allocate_backfill(job)
-            if backfill_status:
-                continue
-            # sort machines based on reverse order of remaining load
-            super()._sort_machines_descending_avail_time()
-            # check whether the job has enough cores to complete
-            # considering multi-core jobs, last core for job c = m - job_core
-            legal_completion_status = self.__check_legal_completion(job)
-            if not legal_completion_status:
-                continue
-            # check whether the job can be legally completed before due time on available cores
-            # greedy acceptance policy
-            acceptance_status = self.__check_acceptance_status(job)
-            if not acceptance_status:
-                continue
-            # allocate job based on greedy balanced allocation policy
-            self.__allocate_greedy_bestfit(job)
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
+    def __init__(self, jobs, machines, metrics_only=False):
+        super().__init__('greedybestfitbackfill', jobs, machines, metrics_only=metrics_only, backfill=True)
+
+    def schedule_job(self, job):
+        # check backfill possibility
+        backfill_status = super().check_and_allocate_backfill(job)
+        if backfill_status:
+            return
+        # sort machines based on reverse order of remaining load
+        super()._sort_machines_descending_avail_time()
+        # check whether the job has enough cores to complete
+        # considering multi-core jobs, last core for job c = m - job_core
+        legal_completion_status = self.__check_legal_completion(job)
+        if not legal_completion_status:
+            return
+        # check whether the job can be legally completed before due time on available cores
+        # greedy acceptance policy
+        acceptance_status = self.__check_acceptance_status(job)
+        if not acceptance_status:
+            return
+        # allocate job based on greedy balanced allocation policy
+        self.__allocate_greedy_bestfit(job)
 
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -943,9 +925,9 @@ class AlgorithmGBestFitBF(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -960,36 +942,27 @@ class AlgorithmGBestFitBF(Algorithm):
 
 class AlgorithmOSScheduling(Algorithm):
 
-    def __init__(self, jobs, machines, epsilon):
-        super().__init__('slack', jobs, machines)
+    def __init__(self, jobs, machines, epsilon, metrics_only=False):
+        super().__init__('slack', jobs, machines, metrics_only=metrics_only)
         self.__epsilon = epsilon
-        self.__array_length = 450000  # release date + 2 * processing time (86400)
-        self.__v_start = np.zeros(self.__array_length)
-        self.__v_end = np.zeros(self.__array_length)
+        # cumulative load of accepted jobs started at release time (v start) and at latest start time (v end)
+        # breakpoints of both are the start and completion times of all submitted jobs
+        release_times = jobs.get_release_times().astype(np.int64)
+        due_times = jobs.get_due_times().astype(np.int64)
+        processing_times = jobs.get_processing_times().astype(np.int64)
+        self.__v_start = CumulativeLoad(np.concatenate((release_times, release_times + processing_times)))
+        self.__v_end = CumulativeLoad(np.concatenate((due_times - processing_times, due_times)))
         self.__tau_values = [0]
         self.__d_min = 0
         self.__fp_epsilon_m = None
 
-    def execute(self):
-        # start time point reference
-        simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
+    def prepare(self):
+        super().prepare()
         # calculate threshold value
         self.__calculate_threshold_expression()
-        # for every job in the list, do
-        while len(super().get_job_list()) > 0:
-            job = super().get_job_fifo()
-            self.__run_acceptance_check(job)
 
-        # end time point reference
-        simulation_end_time = time.time()
-        execution_time = round(simulation_end_time - simulation_start_time, 4)
-        super().update_execution_time(execution_time)
-        # updating the run time logs
-        super()._update_logs()
-        # returning the result of the simulation
-        return super()._results()
+    def schedule_job(self, job):
+        self.__run_acceptance_check(job)
 
     def __calculate_threshold_expression(self):
         # this works, verified with recursive equation
@@ -999,50 +972,30 @@ class AlgorithmOSScheduling(Algorithm):
         expression = expression_1 * expression_2
         self.__fp_epsilon_m = 1 / expression
 
-    def __calculate_v_start_array(self, job):
-        limit_2 = job.get_release_time()
-        limit_3 = job.get_release_time() + job.get_processing_time()
-
-        array_1 = np.zeros(limit_2 + 1)
-        array_2 = np.array([i for i in range(1, limit_3 - limit_2)])
-        array_3 = np.ones(self.__array_length - limit_3) * job.get_processing_time()
-        self.__v_start_job = np.hstack((array_1, array_2, array_3))
-        self.__v_start += self.__v_start_job
-
-    def __calculate_v_end_array(self, job):
-        limit_2 = job.get_due_time() - job.get_processing_time()
-        limit_3 = job.get_due_time()
-
-        array_1 = np.zeros(limit_2 + 1)
-        array_2 = np.array([i for i in range(1, limit_3 - limit_2)])
-        array_3 = np.ones(self.__array_length - limit_3) * job.get_processing_time()
-        self.__v_end_job = np.hstack((array_1, array_2, array_3))
-        self.__v_end += self.__v_end_job
-
     def __update_v_values(self, job):
-        self.__calculate_v_start_array(job)
-        self.__calculate_v_end_array(job)
+        self.__v_start.add(super().get_release_time(job), super().get_processing_time(job))
+        self.__v_end.add(super().get_due_time(job) - super().get_processing_time(job), super().get_processing_time(job))
 
     def __calculate_v_min(self, t, t_prime):
-        return max(0, self.__v_end[t_prime] - self.__v_start[t])
+        return max(0, self.__v_end.get_load(t_prime) - self.__v_start.get_load(t))
 
     def __update_d_min(self, job, compensation_load):
-        job_release_time = job.get_release_time()
+        job_release_time = super().get_release_time(job)
         # the maximum known so far remains at the last due date known
-        max_load_val = max(self.__v_end[self.__tau_values[-1]] - self.__v_end[job_release_time], 0)
+        max_load_val = max(self.__v_end.get_load(self.__tau_values[-1]) - self.__v_end.get_load(job_release_time), 0)
         total_load = compensation_load + max_load_val
         self.__d_min = job_release_time + (total_load / self.__fp_epsilon_m)
 
     def __run_acceptance_check(self, job):
-        job_release_time = job.get_release_time()
-        job_due_time = job.get_due_time()
+        job_release_time = super().get_release_time(job)
+        job_due_time = super().get_due_time(job)
         self.__d_min = max(self.__d_min, job_release_time)
         expression_1 = (self.__d_min - job_release_time) * self.__fp_epsilon_m
         if self.__d_min > self.__tau_values[-1]:
             _d_min = self.__tau_values[-1]
         else:
             _d_min = round(self.__d_min)
-        expression_2 = self.__v_end[_d_min] - self.__v_end[job_release_time]
+        expression_2 = self.__v_end.get_load(_d_min) - self.__v_end.get_load(job_release_time)
         compensation_load = max(0, expression_1 - expression_2)
         if job_due_time >= self.__d_min:
             super().update_accepted(job)
@@ -1055,42 +1008,40 @@ class AlgorithmOSScheduling(Algorithm):
 
 class AlgorithmRegion(Algorithm):
 
-    def __init__(self, jobs, machines, epsilon, alpha=1):
-        super().__init__('region', jobs, machines)
+    def __init__(self, jobs, machines, epsilon, alpha=1, metrics_only=False):
+        super().__init__('region', jobs, machines, metrics_only=metrics_only, preemptive=True)
         # system parameters - no commitment model
         self.__alpha = alpha
         self.__beta = epsilon / 4
         self.__delta = epsilon / 2
 
+        # jobs are kept in heaps in SPT order, jobs with equal processing times in the order they were released
         self.__available_jobs = []
         self.__released_jobs = []
+        self.__released_job_num = 0
         self.__reference_time = None
 
+    def prepare(self):
+        super().prepare()
+        # released jobs are collected first, all jobs released at the same time are scheduled together
+        super().get_event_queue().subscribe(EventQueue.RELEASE, self.__release_job)
+
     def execute(self):
         # start time point reference
         simulation_start_time = time.time()
-        # sort all jobs in ascending order
-        super()._sort_jobs_ascending_release_time()
+        # sort all jobs in ascending order and set up the algorithm
+        self.prepare()
+        events = super().get_event_queue()
         # additional time points
-        current_release_time = 0
         incoming_time = 0
-        while len(super().get_job_list()) > 0:
-            # get the first job in the list
-            job = super().read_job_fifo()
-            self.__reference_time = job.get_release_time()
-
+        while len(events) > 0:
             # collect all jobs released at the same time
-            while super().read_job_fifo().get_release_time() == self.__reference_time:
-                self.__released_jobs.append(super().get_job_fifo())
-                # if there are no jobs left in the list, then break
-                if len(super().get_job_list()) <= 0:
-                    break
+            self.__reference_time = events.get_next_time()
+            events.dispatch(self.__reference_time)
 
             # check for the next incoming job
-            if len(super().get_job_list()) > 0:
-                # there are still jobs left
-                incoming_time = super().read_job_fifo().get_release_time()
-            else:
+            incoming_time = events.get_next_time()
+            if incoming_time is None:
                 # assign some large value
                 incoming_time = sys.maxsize
 
@@ -1103,19 +1054,19 @@ class AlgorithmRegion(Algorithm):
             #    continue
             #else:
             # all released jobs till now are available
-            self.__available_jobs += copy.deepcopy(self.__released_jobs)
-            self.__released_jobs = []
             # jobs need to be scheduled in SPT order
-            self.__available_jobs.sort(key=lambda j: j.get_processing_time(), reverse=False)
+            for released_job in self.__released_jobs:
+                heapq.heappush(self.__available_jobs, released_job)
+            self.__released_jobs = []
             while len(self.__available_jobs) > 0:
                 # if there exists at least one machine, which has processing power before next incoming job
                 # schedule from available jobs
                 super()._sort_machines_descending_avail_time()
-                earliest_available_time = super().get_machine_list()[-1].get_available_time()
+                earliest_available_time = super()._get_machine_avail_time(super().get_machine_num() - 1)
                 # if there are additional jobs which are released in between, then we need to consider then first
                 if earliest_available_time >= incoming_time:
                     break
-                job = self.__available_jobs.pop(0)
+                job = heapq.heappop(self.__available_jobs)[-1]
                 # check whether the job has enough cores to complete
                 # considering multi-core jobs, last core for job c = m - job_core
                 legal_completion_status = self.__check_legal_completion(job)
@@ -1138,40 +1089,33 @@ class AlgorithmRegion(Algorithm):
         # returning the result of the simulation
         return super()._results()
 
+    def __release_job(self, job):
+        heapq.heappush(self.__released_jobs, (super().get_processing_time(job), self.__released_job_num, job))
+        self.__released_job_num += 1
+
     def __preemption_routine(self):
-        # sort all newly released jobs based on the processing time
-        self.__released_jobs.sort(key=lambda j: j.get_processing_time(), reverse=False)
+        # newly released jobs are kept in a heap based on the processing time
         # check for preemption for newly released jobs
         while len(self.__released_jobs) > 0:
-            job = self.__released_jobs[0]
+            job = self.__released_jobs[0][-1]
             # job properties
-            job_processing_time = job.get_processing_time()
-            job_release_time = job.get_release_time()
-            job_due_time = job.get_due_time()
+            job_processing_time = super().get_processing_time(job)
+            job_release_time = super().get_release_time(job)
+            job_due_time = super().get_due_time(job)
             # sort machines based on reference time - smallest to largest
             super()._sort_machines_descending_avail_time()
             status_assigned = False
             for m in range(0, super().get_machine_num()):
                 # if machine does not have even a single container, no need of preemption
                 # exit preemption routine for this machine and check other machines
-                if len(super().get_machine_list()[m].get_scheduled_containers()) <= 0:
-                    continue
-                container_index = super().get_machine_list()[m].get_container_index(self.__reference_time)
-                # if there are no suitable containers, that means the job can be scheduled at the end
-                # exit preemption routine for this machine and check other machines
-                if container_index is None:
+                if super().get_machine(m).get_container_num() <= 0:
                     continue
-                total_containers = len(super().get_machine_list()[m].get_scheduled_containers())
                 # find all containers that overlap with the time period
                 # earliest start time possible = release date of the job
                 # latest start time possible = due date of the job - processing time of the job (tight)
-                container_indices = []
-                for c in range(container_index, total_containers):
-                    start_time = self.get_machine_list()[m].get_scheduled_containers()[c].get_start_time()
-                    if start_time > job_due_time - job_processing_time:
-                        break
-                    else:
-                        container_indices.append(c)
+                # if there are no suitable containers, that means the job can be scheduled at the end
+                container_indices = super().get_machine(m).get_container_range(self.__reference_time,
+                                                                                job_due_time - job_processing_time)
 
                 # now there are no overlapping regions, simply continue to next machine
                 if len(container_indices) <= 0:
@@ -1180,14 +1124,12 @@ class AlgorithmRegion(Algorithm):
                     # check whether the region can be preempted
                     # conditions p_i < beta * p_j for all available containers on this machine
                     for index in container_indices:
-                        start_time = self.get_machine_list()[m].get_scheduled_containers()[index] \
-                            .get_start_time()
-                        end_time = self.get_machine_list()[m].get_scheduled_containers()[index] \
-                            .get_end_time()
+                        container = super().get_machine(m).get_container(index)
+                        start_time = container.get_start_time()
+                        end_time = container.get_end_time()
                         processing_time_j = end_time - start_time
-                        container_type = self.get_machine_list()[m].get_scheduled_containers()[index].get_type()
-                        container_start_time = self.get_machine_list()[m].get_scheduled_containers()[index] \
-                            .get_start_time()
+                        container_type = container.get_type()
+                        container_start_time = container.get_start_time()
                         # job cannot be preempted based on the processing time condition
                         if job_processing_time >= self.__beta * processing_time_j:
                             continue
@@ -1202,9 +1144,10 @@ class AlgorithmRegion(Algorithm):
                                 container_start_time = max(job_release_time, container_start_time)
                                 container_size = self.__alpha * job_processing_time
                                 container_end_time = container_start_time + container_size
-                                machine_id = super().get_machine_list()[m].get_machine_id()
+                                machine_id = super().get_machine(m).get_machine_id()
                                 new_container = Container(super().get_container_id())
-                                new_container.assign(job, container_start_time, container_end_time, machine_id, 0)
+                                new_container.assign(super().get_job_id(job), container_start_time, container_end_time,
+                                                     machine_id, 0)
 
                                 # check whether the previous interval needs to be split
                                 split_container = None
@@ -1212,51 +1155,37 @@ class AlgorithmRegion(Algorithm):
                                     # no need for additional container
                                     # we can fit in new container and simply push the existing one to later time
                                     container_start_time = container_end_time
-                                    container_end_time = super().get_machine_list()[m]. \
-                                        get_scheduled_containers()[index].get_end_time() + container_size
-                                    super().get_machine_list()[m].get_scheduled_containers()[index] \
-                                        .update(container_start_time, container_end_time, 1)
+                                    container_end_time = end_time + container_size
+                                    super().get_machine(m).update_container(index, container_start_time,
+                                                                            container_end_time, 1)
                                 else:
                                     # in case of a split, we need to get additional start time and end time for new
                                     # split container, which starts after the container of our new small job
                                     split_container_start_time = container_end_time
-                                    split_container_end_time = super().get_machine_list()[m]. \
-                                        get_scheduled_containers()[index].get_end_time() + container_size
+                                    split_container_end_time = end_time + container_size
                                     container_end_time = container_start_time
-                                    container_start_time = super().get_machine_list()[m]. \
-                                        get_scheduled_containers()[index].get_start_time()
-                                    container_type = super().get_machine_list()[m]. \
-                                        get_scheduled_containers()[index].get_type()
-                                    super().get_machine_list()[m].get_scheduled_containers()[index] \
-                                        .update(container_start_time, container_end_time, container_type)
+                                    container_start_time = start_time
+                                    super().get_machine(m).update_container(index, container_start_time,
+                                                                            container_end_time, container_type)
 
                                     # creating a new split container
-                                    split_job = super().get_machine_list()[m]. \
-                                        get_scheduled_containers()[index].get_job()
-                                    machine_id = super().get_machine_list()[m].get_machine_id()
+                                    split_job = container.get_job_id()
+                                    machine_id = super().get_machine(m).get_machine_id()
                                     split_container = Container(super().get_container_id())
                                     split_container.assign(split_job, split_container_start_time,
                                                            split_container_end_time, machine_id, 1)
 
                                 # update values for all following containers
-                                for c in range(index + 1, total_containers):
-                                    container_start_time = super().get_machine_list()[m].get_scheduled_containers()[c].\
-                                        get_start_time() + container_size
-                                    container_end_time = super().get_machine_list()[m].get_scheduled_containers()[c]. \
-                                        get_end_time() + container_size
-                                    container_type = super().get_machine_list()[m].get_scheduled_containers()[c]. \
-                                        get_type()
-                                    super().get_machine_list()[m].get_scheduled_containers()[c]. \
-                                        update(container_start_time, container_end_time, container_type)
+                                super().get_machine(m).shift_containers(index + 1, container_size)
 
                                 # add additional containers to the schedule (new, split)
-                                available_time = super().get_machine_list()[m].get_scheduled_containers()[-1] \
-                                    .get_end_time()
+                                available_time = super().get_machine(m).get_container_end_time(
+                                    super().get_machine(m).get_container_num() - 1)
                                 if split_container_end_time is not None:
                                     available_time = max(split_container_end_time, available_time)
-                                super().get_machine_list()[m].update(new_container, available_time)
+                                super().update_machine(m, new_container, available_time)
                                 if split_container_end_time is not None:
-                                    super().get_machine_list()[m].update(split_container, available_time)
+                                    super().update_machine(m, split_container, available_time)
 
                                 status_assigned = True
                                 break
@@ -1267,7 +1196,7 @@ class AlgorithmRegion(Algorithm):
             if status_assigned:
                 # here we update the new job into the schedule
                 super().update_accepted(job)
-                self.__released_jobs.pop(0)
+                heapq.heappop(self.__released_jobs)
             else:
                 return False  # smallest job cannot be preempted, so go back to normal allocation
         return True  # if all jobs can be assigned via preemption, then return true
@@ -1275,7 +1204,7 @@ class AlgorithmRegion(Algorithm):
     def __check_legal_completion(self, job):
         # if a job has more cores than the one available in the simulation set-up, it can never be processed
         # hence the job is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         if start_core < 0:
             super().update_rejected(job)
             return False
@@ -1285,9 +1214,9 @@ class AlgorithmRegion(Algorithm):
     def __check_acceptance_status(self, job):
         # if a job with 'c' cores can be completed on/before its due time on 'c' least loaded cores,
         # then it can be accepted. else, it is rejected
-        start_core = super().get_machine_num() - job.get_job_core()
+        start_core = super().get_machine_num() - super().get_job_core(job)
         completion_time = super()._get_completion_time(job, start_core)
-        if completion_time <= job.get_due_time():
+        if completion_time <= super().get_due_time(job):
             return True
         else:
             super().update_rejected(job)
@@ -1297,4 +1226,186 @@ class AlgorithmRegion(Algorithm):
         # getting starting core of the job
         start_core = super()._search_loaded_machine(job)
         # allocate job to machine using super method
-        super().allocate_job_to_core(job, start_core)
\ No newline at end of file
+        super().allocate_job_to_core(job, start_core)
+
+class Sweep:
+    """
+        a sweep runs several simulations on the same jobs at once.
+        instead of running one simulation after another, all of them advance together in a single pass over the jobs
+        in order of their release times, while each simulation keeps machines of its own.
+        the simulations may differ in the number of machines and in the due times of the jobs, but all of them must
+        share release times, so that they see the jobs in the same order.
+        only algorithms which schedule jobs one by one can be swept, the results are the same as for separate runs.
+
+        the execution time of each simulation is the time spent in its own steps of the shared pass, measured
+        between consecutive steps with a single time stamp per step. unlike the wall clock time of a separate run,
+        it leaves out reading the jobs, which the simulations share.
+    """
+
+    def __init__(self, algorithms):
+        self.__algorithms = algorithms
+        self.__release_order = algorithms[0].get_job_table().get_release_order() if algorithms else []
+        self.__release_times = memoryview(algorithms[0].get_job_table().get_release_times()) if algorithms else None
+        # time taken by each simulation, while it is executed
+        self.__execution_times = []
+        for algorithm in algorithms:
+            if type(algorithm).schedule_job is Algorithm.schedule_job:
+                raise ValueError('{} does not schedule jobs one by one and cannot be swept.'
+                                 .format(type(algorithm).__name__))
+            # job tables with other due times share the release order of their trace, only others are compared
+            if algorithm.get_job_table().get_release_order() is not self.__release_order and \
+                    not np.array_equal(algorithm.get_job_table().get_release_times(),
+                                       algorithms[0].get_job_table().get_release_times()):
+                raise ValueError('Swept simulations must share the release times of the jobs.')
+
+    def get_algorithms(self):
+        return self.__algorithms
+
+    # runs all simulations and returns their results, in the order of the algorithms
+    def execute(self):
+        self.__execution_times = [0.0] * len(self.__algorithms)
+        step_time = time.perf_counter()
+        for index, algorithm in enumerate(self.__algorithms):
+            algorithm.prepare()
+            step_end_time = time.perf_counter()
+            self.__execution_times[index] += step_end_time - step_time
+            step_time = step_end_time
+        # every released job is handed over to all simulations before the next one is released
+        events = EventQueue(JobStream(self.__release_order), self.__release_times)
+        events.subscribe(EventQueue.RELEASE, self.__schedule_job)
+        events.dispatch()
+        return [algorithm.complete(round(execution_time, 4))
+                for algorithm, execution_time in zip(self.__algorithms, self.__execution_times)]
+
+    # hands over a released job to all simulations, one after another
+    def __schedule_job(self, job):
+        step_time = time.perf_counter()
+        for index, algorithm in enumerate(self.__algorithms):
+            algorithm.schedule_job(job)
+            step_end_time = time.perf_counter()
+            self.__execution_times[index] += step_end_time - step_time
+            step_time = step_end_time
+
+
+class IdlePeriodDecomposition:
+    """
+        an idle period decomposition splits a single simulation into independent segments, which can run in parallel.
+        jobs are cut between two jobs in order of release times, where all jobs released so far are due by the
+        release time of the next job. accepted jobs are completed by their due time, so all machines are available
+        by then, whatever the number of machines. for the greedy balanced and greedy bestfit algorithms, such a state
+        is equivalent to a fresh start, as only the busy machines and the release time decide on later jobs.
+        the threshold algorithm is only equivalent, if the f value of the most loaded machine is 0, as it otherwise
+        depends on the available times of the idle machines as well. else, the simulation is not split.
+
+        each segment is simulated without logs on machine groups, the results of the segments are merged into the
+        results of the whole simulation, the execution time is the time of the whole run.
+        by default, or with a single worker, the whole simulation runs as one segment in the calling process.
+        the jobs are only split, if more than one worker is asked for and the simulation does not run in a daemonic
+        process, like the workers of a multiprocessing pool, which cannot have children. an executor may be given,
+        to reuse its workers for several simulations, else a new one is started for each run.
+    """
+
+    def __init__(self, algorithm_class, jobs, machine_num, *args, worker_num=None, executor=None):
+        if algorithm_class not in (AlgorithmGBalanced, AlgorithmGBestFit, AlgorithmThreshold):
+            raise ValueError('{} cannot be decomposed into idle periods.'.format(algorithm_class.__name__))
+        self.__algorithm_class = algorithm_class
+        self.__jobs = jobs
+        self.__machine_num = machine_num
+        self.__args = args
+        self.__worker_num = worker_num if worker_num is not None else 1
+        if multiprocessing.current_process().daemon:
+            self.__worker_num = 1
+        self.__executor = executor
+
+    # positions in release order, where a segment starts after an idle period of all machines
+    @staticmethod
+    def get_cut_points(jobs):
+        release_order = jobs.get_release_order()
+        release_times = jobs.get_release_times()[release_order]
+        # latest due time of all jobs released before each job
+        due_times = np.maximum.accumulate(jobs.get_due_times()[release_order].astype(np.int64))
+        return np.flatnonzero(due_times[:-1] <= release_times[1:]) + 1
+
+    def execute(self):
+        # start time point reference
+        simulation_start_time = time.time()
+        if self.__worker_num == 1:
+            tasks = [(self.__algorithm_class, self.__jobs, self.__machine_num, self.__args)]
+        else:
+            # each segment is a job table of its own, all machines are available at the start of it
+            tasks = [(self.__algorithm_class, self.__jobs.get_rows(rows), self.__machine_num, self.__args)
+                     for rows in self.__get_segments()]
+        if len(tasks) <= 1:
+            segment_results = [IdlePeriodDecomposition._execute_segment(*task) for task in tasks]
+        elif self.__executor is not None:
+            segment_results = list(self.__executor.map(IdlePeriodDecomposition._execute_segment, *zip(*tasks)))
+        else:
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                segment_results = list(executor.map(IdlePeriodDecomposition._execute_segment, *zip(*tasks)))
+        # merging the results of all segments
+        accepted_jobs, rejected_jobs, accepted_load, rejected_load, makespan = 0, 0, 0, 0, 0
+        for results in segment_results:
+            accepted_jobs += results[0]
+            rejected_jobs += results[1]
+            accepted_load += results[2]
+            rejected_load += results[3]
+            makespan = max(makespan, results[4])
+        optimal_load = min(self.__machine_num * makespan, accepted_load + rejected_load)
+        # end time point reference
+        simulation_end_time = time.time()
+        execution_time = round(simulation_end_time - simulation_start_time, 4)
+        return [accepted_jobs, rejected_jobs, accepted_load, rejected_load, optimal_load, execution_time]
+
+    # rows of the job table for each segment in release order, consecutive segments are joined into one per worker
+    def __get_segments(self):
+        release_order = self.__jobs.get_release_order()
+        cut_points = IdlePeriodDecomposition.get_cut_points(self.__jobs)
+        if self.__algorithm_class is AlgorithmThreshold:
+            f_values = AlgorithmThreshold.get_f_values(self.__machine_num, *self.__args)
+            if f_values is None or f_values[1] != 0:
+                cut_points = cut_points[:0]
+        # cuts closest to an even split of the jobs over the workers
+        segment_num = self.__worker_num
+        even_cuts = np.arange(1, segment_num) * len(release_order) / segment_num
+        cut_points = np.unique(cut_points[np.minimum(np.searchsorted(cut_points, even_cuts),
+                                                     len(cut_points) - 1)]) if len(cut_points) > 0 else cut_points
+        return np.split(release_order, cut_points)
+
+    @staticmethod
+    def _execute_segment(algorithm_class, jobs, machine_num, args):
+        algorithm = algorithm_class(jobs, Operations.get_machine_groups(machine_num), *args, metrics_only=True)
+        results = algorithm.execute()
+        return results[:4] + [algorithm.get_makespan()]
+
+
+class Experiment(Sweep):
+    """
+        an experiment runs several algorithms on the same jobs, usually with the same number of machines.
+        all algorithms advance together in a single pass over the jobs, while each of them keeps machines of its own.
+        the results of the algorithms are combined into a single row, the results of each algorithm in the given
+        order followed by the optimal load, which is the largest optimal load found by any of the algorithms.
+    """
+
+    def execute(self):
+        return Experiment.get_results_row(super().execute())
+
+    @staticmethod
+    def get_results_row(results):
+        row = []
+        for result in results:
+            row += result
+        row.append(max(result[4] for result in results))
+        return row
+
+    # runs several experiments on jobs with the same release times in a single pass
+    # returns the results row of each experiment, in the given order
+    @staticmethod
+    def execute_all(experiments):
+        results = Sweep([algorithm for experiment in experiments for algorithm in experiment.get_algorithms()]) \
+            .execute()
+        rows = []
+        for experiment in experiments:
+            algorithm_num = len(experiment.get_algorithms())
+            rows.append(Experiment.get_results_row(results[:algorithm_num]))
+            results = results[algorithm_num:]
+        return rows
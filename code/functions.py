@@ -1,13 +1,13 @@
-import math
 import os
 import shutil
+import numpy as np
 
 from datetime import datetime
 from code.settings import CLOUD_TRACE_FOLDER, SLACK_FOLDER, STATISTICAL_TRACE_FOLDER
-from code.settings import RESULT_FOLDER, LOG_FOLDER
+from code.settings import RESULT_FOLDER, LOG_FOLDER, CACHE_FOLDER
 from code.settings import RAW
 from code.settings import TRACE, DAYS, SLACKS, SD, SETS
-from code.schedulingelements import Job, Machine
+from code.schedulingelements import JobTable, Machine, MachineGroups
 from code.settings import MACHINE_START, MACHINE_END, MACHINE_INCREMENT
 
 
@@ -17,19 +17,16 @@ class Operations:
 
     # Methods available for external use
 
-    # Read jobs from statistical trace file and returns them as a list
+    # Read jobs from statistical trace file and returns them as a job table
     @staticmethod
     def get_jobs(job_file):
-        with open(job_file) as file:
-            contents = file.readlines()
-
-        jobs = []
-        for data in contents:
-            job_data = data.strip().split(';')
-            job = Job(job_data[0], int(job_data[1]), int(job_data[2]), int(job_data[3]), int(job_data[4]))
-            jobs.append(job)
+        # columns: job id; processing time; release time; due time; job cores; slack;
+        # the file is parsed once as text, the columns are converted afterwards, job ids may contain '#'
+        job_data = np.loadtxt(job_file, dtype=str, delimiter=';', usecols=(0, 1, 2, 3, 4, 5), ndmin=2, comments=None)
+        job_times = job_data[:, 1:5].astype(np.int64)
 
-        return jobs
+        return JobTable(job_data[:, 0], job_times[:, 0], job_times[:, 1], job_times[:, 2], job_times[:, 3],
+                        job_data[:, 5].astype(np.float64))
 
     # Initialize machines and return a list
     @staticmethod
@@ -41,6 +38,11 @@ class Operations:
 
         return machines
 
+    # Initialize machines as machine groups, where identical machines are only counted
+    @staticmethod
+    def get_machine_groups(machine_num):
+        return MachineGroups(machine_num)
+
     # Generates statistical trace based on slack files and trace jobs
     # Can be generated for all days at once or all traces for a single day based on day_nr=None
     @staticmethod
@@ -56,6 +58,8 @@ class Operations:
         Operations.update_system_log('Started trace generation.')
         for day in period:
             jobs = Operations.__get_jobs(trace_id, day, core)
+            release_times = jobs.get_release_times()
+            processing_times = jobs.get_processing_times()
             for num in SETS:
                 for slack in SLACKS:
                     for value in SD:
@@ -71,16 +75,38 @@ class Operations:
                         print('Generating file ', statistical_trace_file)
                         Operations.update_system_log("Generating file {}".format(statistical_trace_file))
                         file = open(file_location + statistical_trace_file, 'w')
-                        for job in jobs:
-                            release_time = job.get_release_time()
-                            processing_time = job.get_processing_time()
-                            epsilon = slacks.pop()
-                            due_time = math.ceil(release_time + (1 + epsilon) * processing_time)
-                            file.write(Operations.__get_csv_details(job, due_time, epsilon))
+                        epsilons = Operations.__pop_slacks(slacks, len(jobs))
+                        due_times = np.ceil(release_times + (1 + epsilons) * processing_times)
+                        file.writelines(Operations.__get_csv_details(jobs, due_times, epsilons))
                         file.close()
                         Operations.update_system_log("Completed file {}".format(statistical_trace_file))
         Operations.update_system_log('Completed trace generation')
 
+    # Converts the raw trace of a day into a binary cache with one file per column, unless the cache is up to date
+    # The cache is rebuilt, when modification time or size of the raw trace file change
+    # Returns job ids, processing times, release times, job cores and accept mask, followed by the core index,
+    # all memory mapped from the cache. The core index holds the rows of the accepted jobs in ascending order of
+    # their job cores, together with these job cores, so the jobs of any core class are a prefix of the index
+    @staticmethod
+    def ingest_trace(trace_id, day):
+        trace_file = CLOUD_TRACE_FOLDER[trace_id] + Operations.__get_trace_file_name(trace_id, day)
+        cache_location = Operations.__get_trace_cache_location(trace_id, day)
+        trace_stat = os.stat(trace_file)
+        source = np.array([trace_stat.st_mtime_ns, trace_stat.st_size], dtype=np.int64)
+        source_location = cache_location + 'source.npy'
+        columns = ('jobids', 'processingtimes', 'releasetimes', 'jobcores', 'accept', 'corerows', 'rowcores')
+        if not os.path.exists(source_location) or not np.array_equal(np.load(source_location), source) or \
+                not all(os.path.exists(cache_location + column + '.npy') for column in columns):
+            Operations.__update_trace_cache(trace_file, cache_location, source)
+        return tuple(np.load(cache_location + column + '.npy', mmap_mode='r') for column in columns)
+
+    # Converts the raw traces of the given days to the binary cache once, before the workers of a launcher read them,
+    # so that the workers only map the cached columns instead of each parsing and writing the same raw trace
+    @staticmethod
+    def ingest_traces(trace_id, days):
+        for day in sorted(set(days)):
+            Operations.ingest_trace(trace_id, day)
+
     @staticmethod
     def read_jobs_iso(trace_id, day, core):
         # Started reading jobs - for particular day
@@ -104,18 +130,22 @@ class Operations:
         print('Generating file ', statistical_trace_file)
         #Operations.update_system_log("Generating file {}".format(statistical_trace_file))
         file = open(file_location + statistical_trace_file, 'w')
-        for job in jobs:
-            release_time = job.get_release_time()
-            processing_time = job.get_processing_time()
-            epsilon = slacks.pop()
-            due_time = math.ceil(release_time + (1 + epsilon) * processing_time)
-            file.write(Operations.__get_csv_details(job, due_time, epsilon))
+        due_times, epsilons = Operations.__get_statistical_due_times(jobs, slacks)
+        file.writelines(Operations.__get_csv_details(jobs, due_times, epsilons))
         file.close()
 
         print('Completed file ', statistical_trace_file)
         #Operations.update_system_log("Completed file {}".format(statistical_trace_file))
         #Operations.update_system_log('Completed trace generation')
 
+    # Statistical trace as a job table, with the same jobs as the trace file but without writing and reading it
+    # the job table shares all columns except due times and slacks with the trace jobs
+    @staticmethod
+    def get_statistical_trace_iso(jobs, slack_set, slack, standard_deviation, set_num):
+        slacks = Operations.__get_lognormal_slacks(slack_set, slack, standard_deviation, set_num)
+        due_times, epsilons = Operations.__get_statistical_due_times(jobs, slacks)
+        return jobs.with_due_times(due_times, epsilons)
+
     # Provides location of trace files based on simulation run type
     # single=False, when we have enough space and all traces are generated well in advance
     # single=True, when we generate trace for a day, run simulation and then clear it at the end
@@ -229,7 +259,7 @@ class Operations:
         file.close()
 
     @staticmethod
-    def update_job_log(algorithm_id, accepted_jobs, rejected_jobs):
+    def update_job_log(algorithm_id, job_stats):
         file_folder = LOG_FOLDER + algorithm_id + '/'
         if not os.path.exists(file_folder):
             os.makedirs(file_folder)
@@ -237,11 +267,40 @@ class Operations:
         file = open(file_location, 'w')
 
         stamp = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        jobs = accepted_jobs + rejected_jobs
-        for job in jobs:
-            file.write("{} \t {}\n".format(stamp, job.get_stat()))
+        for job_stat in job_stats:
+            file.write("{} \t {}\n".format(stamp, job_stat))
         file.close()
 
+    # Reads f values of the threshold algorithm for a number of machines and epsilon from the cache
+    # Returns None, if they are not cached yet
+    @staticmethod
+    def read_f_values(machine_num, epsilon):
+        file_location = CACHE_FOLDER + Operations.__get_f_value_file_name(machine_num, epsilon)
+        if not os.path.exists(file_location):
+            return None
+        return np.load(file_location)
+
+    # Stores f values of the threshold algorithm in the cache, the file is replaced at once so that parallel
+    # simulations never read a partly written file
+    @staticmethod
+    def update_f_values(machine_num, epsilon, f_values):
+        if not os.path.exists(CACHE_FOLDER):
+            os.makedirs(CACHE_FOLDER, exist_ok=True)
+        file_location = CACHE_FOLDER + Operations.__get_f_value_file_name(machine_num, epsilon)
+        Operations.__save_array(file_location, f_values)
+
+    # Stores an array in a file, which is replaced at once
+    @staticmethod
+    def __save_array(file_location, array):
+        temporary_location = "{}.{}.tmp".format(file_location, os.getpid())
+        with open(temporary_location, 'wb') as file:
+            np.save(file, array)
+        os.replace(temporary_location, file_location)
+
+    @staticmethod
+    def __get_f_value_file_name(machine_num, epsilon):
+        return "FValuesM{}E{}.npy".format(machine_num, repr(float(epsilon)))
+
     @staticmethod
     def clear_all_logs():
         contents = []
@@ -293,6 +352,41 @@ class Operations:
                '.txt'
         return file
 
+    @staticmethod
+    def __get_trace_cache_location(trace_id, day):
+        return CACHE_FOLDER + 'traces/' + RAW[trace_id] + 'D' + str(day) + '/'
+
+    # Parses the raw trace file and stores its columns in the cache, the source file is recorded last
+    # so that a partly written cache is never taken for an up to date one
+    @staticmethod
+    def __update_trace_cache(trace_file, cache_location, source):
+        if not os.path.exists(cache_location):
+            os.makedirs(cache_location, exist_ok=True)
+        try:
+            os.remove(cache_location + 'source.npy')
+        except FileNotFoundError:
+            pass
+
+        # columns used: 0 job id, 3 processing time, 8 release time, 10 job category, 11 job cores
+        # raw fields may contain '#', the traces have no comment lines
+        trace_data = np.loadtxt(trace_file, dtype=str, delimiter='\t', usecols=(0, 3, 8, 10, 11), ndmin=2,
+                                comments=None)
+        job_categories = trace_data[:, 3]
+        job_data = trace_data[:, [1, 2, 4]].astype(np.int64)
+
+        Operations.__save_array(cache_location + 'jobids.npy', trace_data[:, 0].copy())
+        Operations.__save_array(cache_location + 'processingtimes.npy', job_data[:, 0].copy())
+        Operations.__save_array(cache_location + 'releasetimes.npy', job_data[:, 1].copy())
+        Operations.__save_array(cache_location + 'jobcores.npy', job_data[:, 2].copy())
+        accept = np.char.lower(job_categories) == 'accept'
+        Operations.__save_array(cache_location + 'accept.npy', accept)
+        # accepted jobs are sorted by job cores once, jobs with equal job cores stay in the order of the trace
+        core_rows = np.flatnonzero(accept)
+        core_rows = core_rows[np.argsort(job_data[core_rows, 2], kind='stable')]
+        Operations.__save_array(cache_location + 'corerows.npy', core_rows)
+        Operations.__save_array(cache_location + 'rowcores.npy', job_data[core_rows, 2])
+        Operations.__save_array(cache_location + 'source.npy', source)
+
     @staticmethod
     def __get_statistical_trace_file_name(trace_id, day, slack, standard_deviation, core, set_num):
         file = TRACE[trace_id] + \
@@ -337,36 +431,44 @@ class Operations:
 
         return slacks
 
+    # slacks are assigned to jobs by popping them from the end of the list, one slack per job
+    @staticmethod
+    def __pop_slacks(slacks, job_num):
+        if job_num > len(slacks):
+            raise IndexError('pop from empty list')
+        epsilons = np.array(slacks[len(slacks) - job_num:][::-1])
+        del slacks[len(slacks) - job_num:]
+        return epsilons
+
+    # due times of the jobs with slacks assigned by popping them from the slack list
+    @staticmethod
+    def __get_statistical_due_times(jobs, slacks):
+        epsilons = Operations.__pop_slacks(slacks, len(jobs))
+        due_times = np.ceil(jobs.get_release_times() + (1 + epsilons) * jobs.get_processing_times())
+        return due_times.astype(np.int64), epsilons
+
     @staticmethod
     def __get_jobs(trace_id, day, core):
-        file_name = Operations.__get_trace_file_name(trace_id, day)
-        trace_file = CLOUD_TRACE_FOLDER[trace_id] + file_name
-        with open(trace_file) as file:
-            contents = file.readlines()
+        # the raw trace is only parsed once, afterwards its columns are read from the cache
+        job_ids, processing_times, release_times, job_cores, _, core_rows, row_cores = \
+            Operations.ingest_trace(trace_id, day)
 
-        jobs = []
-        for data in contents:
-            job_data = data.strip().split('\t')
-            job_core = int(job_data[11])
-            job_category = job_data[10]
-
-            if job_core <= core and job_category.lower().__eq__('accept'):
-                job_id = job_data[0]
-                processing_time = int(job_data[3])
-                release_time = int(job_data[8])
-                due_time = 0
-                job = Job(job_id, processing_time, release_time, due_time, job_core)
-                jobs.append(job)
-        return jobs
+        # accepted jobs with at most core cores are a prefix of the core index, which is put back in trace order
+        selected = np.sort(core_rows[:np.searchsorted(row_cores, core, side='right')])
+        due_times = np.zeros(len(selected))
+        return JobTable(job_ids[selected], processing_times[selected], release_times[selected], due_times,
+                        job_cores[selected])
 
     @staticmethod
-    def __get_csv_details(job, due_time, slack):
-        return ("{};{};{};{};{};{};\n".format(job.get_job_id(),
-                                              job.get_processing_time(),
-                                              job.get_release_time(),
-                                              due_time,
-                                              job.get_job_core(),
-                                              slack))
+    def __get_csv_details(jobs, due_times, slacks):
+        return ["{};{};{};{};{};{};\n".format(job_id, processing_time, release_time, due_time, job_core, slack)
+                for job_id, processing_time, release_time, due_time, job_core, slack
+                in zip(jobs.get_job_ids().tolist(),
+                       jobs.get_processing_times().tolist(),
+                       jobs.get_release_times().tolist(),
+                       due_times.astype(np.int64).tolist(),
+                       jobs.get_job_cores().tolist(),
+                       slacks.tolist())]
 
 
 
@@ -74,6 +74,8 @@ def _run_simulation():
 
     print("Total {} cores.".format(line))
 
+    Operations.ingest_traces(trace_id, [parameters[0] for parameters in parameters_batch_1])
+
     scheduler = Scheduler()
     pool = Pool()
     pool.starmap(scheduler.run_specific_day, parameters_batch_1)
@@ -1,3 +1,11 @@
+import bisect
+import heapq
+import numpy as np
+
+# Job, Container, GangContainer and Machine keep their attributes in slots instead of a dictionary per object,
+# as a simulation creates one of them for every job, container or core.
+# Job, Container and Machine are copied with clone, which copies the fields that change and shares the others.
+
 class Job:
     """
     Each submitted job is stored as an object of the Job class.
@@ -9,6 +17,10 @@ class Job:
     There are both read and write methods to access these parameters.
     There are additional methods to access job details as a string as well as to print these details.
     """
+
+    __slots__ = ('__job_id', '__processing_time', '__release_time', '__due_time', '__job_core',
+                 '__weight', '__start_time', '__completion_time')
+
     def __init__(self, job_id, processing_time, release_time, due_time, job_core):
         self.__job_id = job_id
         self.__processing_time = processing_time
@@ -25,6 +37,11 @@ class Job:
         self.__completion_time = completion_time
         self.__weight = weight
 
+    def clone(self):
+        job = Job(self.__job_id, self.__processing_time, self.__release_time, self.__due_time, self.__job_core)
+        job.update(self.__start_time, self.__completion_time, self.__weight)
+        return job
+
     def get_job_id(self):
         return self.__job_id
 
@@ -68,27 +85,237 @@ class Job:
         print(self.get_details())
 
 
+class JobTable:
+    """
+    Job table stores all submitted jobs of a trace column by column, instead of one Job object per job.
+    Each column is a numpy array, where row i holds the i-th job in the order in which it was read.
+    Ids are kept as strings, processing time, release time, due time and job cores as int32 and slacks as float32.
+
+    Within a simulation, a job is referred to by its row index in the table.
+    A Job object can still be generated for a single row, when details of that job are needed.
+
+    The columns are read only, so a single table can be shared by all simulation runs on the same trace.
+    Start time, completion time and weight of the jobs are kept per run in a JobOutcomes object.
+    """
+
+    def __init__(self, job_ids, processing_times, release_times, due_times, job_cores, slacks=None):
+        self.__job_ids = np.asarray(job_ids, dtype=str)
+        self.__processing_times = np.asarray(processing_times, dtype=np.int32)
+        self.__release_times = np.asarray(release_times, dtype=np.int32)
+        self.__due_times = np.asarray(due_times, dtype=np.int32)
+        self.__job_cores = np.asarray(job_cores, dtype=np.int32)
+        if slacks is None:
+            slacks = np.zeros(len(self.__job_ids))
+        self.__slacks = np.asarray(slacks, dtype=np.float32)
+        for column in (self.__job_ids, self.__processing_times, self.__release_times, self.__due_times,
+                       self.__job_cores, self.__slacks):
+            column.setflags(write=False)
+        self.__release_order = None
+
+    def __len__(self):
+        return len(self.__job_ids)
+
+    # job table of the same jobs with other due times and slacks, all other columns are shared with this table
+    def with_due_times(self, due_times, slacks=None):
+        jobs = JobTable(self.__job_ids, self.__processing_times, self.__release_times, due_times, self.__job_cores,
+                        slacks)
+        jobs.__release_order = self.get_release_order()
+        return jobs
+
+    # job table of the given rows of this table, in the given order
+    def get_rows(self, rows):
+        return JobTable(self.__job_ids[rows], self.__processing_times[rows], self.__release_times[rows],
+                        self.__due_times[rows], self.__job_cores[rows], self.__slacks[rows])
+
+    def get_job_ids(self):
+        return self.__job_ids
+
+    def get_processing_times(self):
+        return self.__processing_times
+
+    def get_release_times(self):
+        return self.__release_times
+
+    def get_due_times(self):
+        return self.__due_times
+
+    def get_job_cores(self):
+        return self.__job_cores
+
+    # row indices of all jobs in ascending order of their release times, jobs released together keep their order
+    def get_release_order(self):
+        if self.__release_order is None:
+            self.__release_order = np.argsort(self.__release_times, kind='stable')
+            self.__release_order.setflags(write=False)
+        return self.__release_order
+
+    def get_job(self, index):
+        return Job(str(self.__job_ids[index]),
+                   int(self.__processing_times[index]),
+                   int(self.__release_times[index]),
+                   int(self.__due_times[index]),
+                   int(self.__job_cores[index]))
+
+    def get_stat(self, index, start_time=0, completion_time=0, weight=0):
+        return ("{}; {}; {}; {}; {}; {}; {}; {};".format(self.__job_ids[index],
+                                                         self.__job_cores[index],
+                                                         self.__processing_times[index],
+                                                         self.__release_times[index],
+                                                         self.__due_times[index],
+                                                         start_time,
+                                                         completion_time,
+                                                         weight))
+
+
+class JobStream:
+    """
+    Job stream hands out the jobs of a simulation one by one, in the order in which they are to be scheduled.
+    It is a cursor over an array of row indices of the job table, usually the release order of the table,
+    so taking the next job does not change the array and costs constant time.
+    """
+
+    def __init__(self, jobs):
+        self.__jobs = memoryview(np.asarray(jobs, dtype=np.int64))
+        self.__position = 0
+
+    # number of jobs left in the stream
+    def __len__(self):
+        return len(self.__jobs) - self.__position
+
+    # returns the next job without taking it from the stream
+    def read_job(self):
+        return self.__jobs[self.__position]
+
+    # returns the next job and moves on to the one after it
+    def get_job(self):
+        job = self.__jobs[self.__position]
+        self.__position += 1
+        return job
+
+
+class EventQueue:
+    """
+    Event queue holds the events of a simulation in order of their time.
+    Job releases are read from a job stream, which is already in order of release times, all other events like
+    container completions and hole expiries are kept in a heap. Both are merged whenever the next event is taken.
+
+    Simulations subscribe a handler to each type of event they need, which is called with the item of the event.
+    Events of a type without any subscriber are dropped, when they are added, so they cost nothing.
+    Events at the same time are handled in order of their type, completions and expiries before releases,
+    so a machine or hole which becomes free at a time point is free for the jobs released then.
+    Events of the same type and time are handled in the order in which they were added.
+    """
+
+    COMPLETION = 0
+    HOLE_EXPIRY = 1
+    RELEASE = 2
+
+    def __init__(self, jobs=None, release_times=None):
+        # job stream and release times of the jobs in it, indexed by job
+        self.__jobs = jobs
+        self.__release_times = release_times
+        # events other than releases as (time, type, sequence number, item)
+        self.__events = []
+        self.__event_num = 0
+        self.__handlers = {}
+
+    def __len__(self):
+        return len(self.__events) + (len(self.__jobs) if self.__jobs is not None else 0)
+
+    def subscribe(self, event_type, handler):
+        self.__handlers[event_type] = handler
+
+    def add(self, time, event_type, item):
+        if event_type in self.__handlers:
+            heapq.heappush(self.__events, (time, event_type, self.__event_num, item))
+            self.__event_num += 1
+
+    # time of the next event, None if there are no events left
+    def get_next_time(self):
+        event = self.__read_event()
+        return event[0] if event is not None else None
+
+    # handles all events until the given time, including the ones at that time, or all events if no time is given
+    def dispatch(self, until_time=None):
+        event = self.__read_event()
+        while event is not None and (until_time is None or event[0] <= until_time):
+            event_type, item = self.__take_event(event)
+            handler = self.__handlers.get(event_type)
+            if handler is not None:
+                handler(item)
+            event = self.__read_event()
+
+    # next event without taking it, the earlier one of the next release and the first event in the heap
+    def __read_event(self):
+        if self.__jobs is not None and len(self.__jobs) > 0:
+            job = self.__jobs.read_job()
+            release = (self.__release_times[job], EventQueue.RELEASE, job)
+            if len(self.__events) > 0 and self.__events[0][:2] < release[:2]:
+                return self.__events[0]
+            return release
+        if len(self.__events) > 0:
+            return self.__events[0]
+        return None
+
+    # takes the given next event from either the job stream or the heap, returns its type and item
+    def __take_event(self, event):
+        if len(event) == 3:
+            self.__jobs.get_job()
+            return event[1], event[2]
+        _, event_type, _, item = heapq.heappop(self.__events)
+        return event_type, item
+
+
+class JobOutcomes:
+    """
+    Job outcomes hold the start time, completion time and weight of all jobs of a job table for a single run.
+    Each is a preallocated array with one entry per row of the job table, all zero until a job is scheduled.
+    Keeping these apart from the job table lets every run start without copying the submitted jobs.
+    """
+
+    def __init__(self, job_num):
+        self.__start_times = np.zeros(job_num, dtype=np.int64)
+        self.__completion_times = np.zeros(job_num, dtype=np.int64)
+        self.__weights = np.zeros(job_num, dtype=np.int64)
+
+    def update(self, index, start_time, completion_time, weight=0):
+        self.__start_times[index] = start_time
+        self.__completion_times[index] = completion_time
+        self.__weights[index] = weight
+
+    def get_start_time(self, index):
+        return self.__start_times[index]
+
+    def get_completion_time(self, index):
+        return self.__completion_times[index]
+
+    def get_weight(self, index):
+        return self.__weights[index]
+
+
 class Container:
     """
     Container class becomes building block for schedule on a machine.
-    Each container object will have a unique id, a job, start times and end times.
+    Each container object will have a unique id, the id of its job, start times and end times.
     In case of non-preemptive schedule, each job will have one container.
     In case of preemptive schedule, a job may be distributed across 2 or more containers.
 
     There are additional methods to access container details as a string as well as to print these details.
     """
 
+    __slots__ = ('__id', '__job_id', '__start_time', '__end_time', '__vacant_size', '__machine', '__type')
+
     def __init__(self, container_id):
         self.__id = container_id
-        self.__job = None
+        self.__job_id = None
         self.__start_time = None
         self.__end_time = None
         self.__vacant_size = None
         self.__machine = None
         self.__type = None
 
-    def assign(self, job, start_time, end_time, machine_id, container_type=0):
-        self.__job = job
+    def assign(self, job_id, start_time, end_time, machine_id, container_type=0):
+        self.__job_id = job_id
         self.__start_time = start_time
         self.__end_time = end_time
         self.__machine = machine_id
@@ -106,11 +333,21 @@ class Container:
         self.__end_time = end_time
         self.__type = container_type
 
+    def clone(self):
+        container = Container(self.__id)
+        container.__job_id = self.__job_id
+        container.__start_time = self.__start_time
+        container.__end_time = self.__end_time
+        container.__vacant_size = self.__vacant_size
+        container.__machine = self.__machine
+        container.__type = self.__type
+        return container
+
     def get_id(self):
         return self.__id
 
-    def get_job(self):
-        return self.__job
+    def get_job_id(self):
+        return self.__job_id
 
     def get_start_time(self):
         return self.__start_time
@@ -135,7 +372,7 @@ class Container:
                                                                                 self.__end_time))
         else:
             return ("Container {}: Job {}, start = {}, end = {} on machine {}".format(self.__id,
-                                                                                      self.__job.get_job_id(),
+                                                                                      self.__job_id,
                                                                                       self.__start_time,
                                                                                       self.__end_time,
                                                                                       self.__machine))
@@ -144,27 +381,307 @@ class Container:
         print(self.get_details())
 
 
+class GangContainer:
+    """
+    Gang container is a single record for a job, which is processed on several cores at the same time,
+    or for an idle slot, which several cores share between the same start and end times.
+    Instead of one container per core, only the start time, end time and the ids of its machines are kept.
+    Idle slots on machine groups belong to no particular machine, they only know the number of their cores.
+
+    A gang takes the container ids from its own id onwards, one for each core, so that the containers of the cores
+    are created with the same ids and in the same order as separate containers would be.
+    They are only created when they are needed, e.g. when a job is backfilled into some of the cores.
+
+    A gang may be put on all machines of its cores, as long as its containers are not changed on any single one.
+    """
+
+    __slots__ = ('__id', '__core_num', '__job_id', '__start_time', '__end_time', '__vacant_size', '__machines',
+                 '__type')
+
+    def __init__(self, container_id, core_num):
+        self.__id = container_id
+        self.__core_num = core_num
+        self.__job_id = None
+        self.__start_time = None
+        self.__end_time = None
+        self.__vacant_size = None
+        self.__machines = None
+        self.__type = None
+
+    def assign(self, job_id, start_time, end_time, machine_ids, container_type=0):
+        self.__job_id = job_id
+        self.__start_time = start_time
+        self.__end_time = end_time
+        self.__machines = machine_ids
+        self.__vacant_size = 0
+        self.__type = container_type
+
+    def reserve(self, start_time, end_time, vacant_size, machine_ids):
+        self.__start_time = start_time
+        self.__end_time = end_time
+        self.__vacant_size = vacant_size
+        self.__machines = machine_ids
+
+    def get_id(self):
+        return self.__id
+
+    def get_core_num(self):
+        return self.__core_num
+
+    def get_job_id(self):
+        return self.__job_id
+
+    def get_start_time(self):
+        return self.__start_time
+
+    def get_end_time(self):
+        return self.__end_time
+
+    def get_machines(self):
+        return self.__machines
+
+    def get_vacant_size(self):
+        return self.__vacant_size
+
+    def get_type(self):
+        return self.__type
+
+    # separate container for each core of the gang
+    def get_containers(self):
+        containers = []
+        for core in range(self.__core_num):
+            machine_id = int(self.__machines[core]) if self.__machines is not None else None
+            container = Container(self.__id + core)
+            if self.__vacant_size > 0:
+                container.reserve(self.__start_time, self.__end_time, self.__vacant_size, machine_id)
+            else:
+                container.assign(self.__job_id, self.__start_time, self.__end_time, machine_id, self.__type)
+            containers.append(container)
+        return containers
+
+    def get_details(self):
+        return '\n'.join(container.get_details() for container in self.get_containers())
+
+    def print_details(self):
+        print(self.get_details())
+
+
+class CumulativeLoad:
+    """
+    Cumulative load is the total processed length of a set of jobs up to a point in time, when each job
+    is processed without interruption from a given start time. A job started at a with length p adds
+    min(max(t - a, 0), p) at time t, a piecewise linear function with breakpoints a and a + p.
+
+    All breakpoints have to be known beforehand, they are collected from the job data.
+    Slopes and offsets of the pieces are kept in Fenwick trees over the sorted breakpoints,
+    so that adding a job and reading the load at a point in time both take logarithmic time.
+    """
+
+    def __init__(self, breakpoints):
+        self.__breakpoints = np.unique(np.asarray(breakpoints, dtype=np.int64)).tolist()
+        self.__slopes = [0] * (len(self.__breakpoints) + 1)
+        self.__offsets = [0] * (len(self.__breakpoints) + 1)
+
+    def __update(self, breakpoint, slope, offset):
+        index = bisect.bisect_left(self.__breakpoints, breakpoint) + 1
+        while index < len(self.__slopes):
+            self.__slopes[index] += slope
+            self.__offsets[index] += offset
+            index += index & -index
+
+    def add(self, start_time, length):
+        self.__update(start_time, 1, -start_time)
+        self.__update(start_time + length, -1, start_time + length)
+
+    def get_load(self, time):
+        index = bisect.bisect_right(self.__breakpoints, time)
+        slope = 0
+        offset = 0
+        while index > 0:
+            slope += self.__slopes[index]
+            offset += self.__offsets[index]
+            index -= index & -index
+        return slope * time + offset
+
+
+class HoleStore:
+    """
+    Hole store holds the open containers, the idle slots left on machines in front of allocated jobs.
+    Holes are indexed by their start time, so the holes starting before a time point are found by binary search.
+    Jobs are processed in order of release time, so a hole which ends by the release time of a job can never be
+    used again. Such holes are evicted in order of their end time, whenever holes are looked up.
+
+    Holes are handed out in the order in which they were created, which is the order of their container ids.
+    A hole may be a gang container for several cores, which is split up into one hole per core once it is expanded.
+    """
+
+    def __init__(self):
+        # holes in ascending order of start time and container id, with these keys in a separate list
+        self.__keys = []
+        self.__holes = []
+        # end time and container id of all holes, to evict them once they end
+        self.__end_times = []
+
+    def __len__(self):
+        return len(self.__holes)
+
+    def add(self, container):
+        key = (container.get_start_time(), container.get_id())
+        index = bisect.bisect_left(self.__keys, key)
+        self.__keys.insert(index, key)
+        self.__holes.insert(index, container)
+        heapq.heappush(self.__end_times, (container.get_end_time(), container.get_id(), container.get_start_time()))
+
+    def remove(self, container):
+        index = bisect.bisect_left(self.__keys, (container.get_start_time(), container.get_id()))
+        if index < len(self.__keys) and self.__holes[index] is container:
+            self.__keys.pop(index)
+            self.__holes.pop(index)
+
+    # removes all holes which end by the given time
+    def evict(self, time):
+        while len(self.__end_times) > 0 and self.__end_times[0][0] <= time:
+            _, container_id, start_time = heapq.heappop(self.__end_times)
+            index = bisect.bisect_left(self.__keys, (start_time, container_id))
+            # holes which are already used are no longer in the store
+            if index < len(self.__keys) and self.__keys[index] == (start_time, container_id):
+                self.__keys.pop(index)
+                self.__holes.pop(index)
+
+    # holes overlapping the period from start time till end time, in the order in which they were created
+    # holes ending by start time are evicted, so start time must not decrease between calls
+    def get_holes(self, start_time, end_time):
+        self.evict(start_time)
+        index = bisect.bisect_left(self.__keys, (end_time,))
+        return sorted(self.__holes[:index], key=lambda c: c.get_id())
+
+    # replaces a gang container by the holes of its cores, which are returned in order of their ids
+    def expand(self, gang):
+        index = bisect.bisect_left(self.__keys, (gang.get_start_time(), gang.get_id()))
+        if index >= len(self.__keys) or self.__holes[index] is not gang:
+            return []
+        containers = gang.get_containers()
+        # the holes of the cores take the ids of the gang, so they stay at its place in the store
+        self.__keys[index:index + 1] = [(container.get_start_time(), container.get_id()) for container in containers]
+        self.__holes[index:index + 1] = containers
+        # the first hole has the key of the gang, which is already due to be evicted
+        for container in containers[1:]:
+            heapq.heappush(self.__end_times, (container.get_end_time(), container.get_id(),
+                                              container.get_start_time()))
+        return containers
+
+
 class Machine:
     """
     Each machine class represents a single core in the real world.
     An object of this class holds a series of containers, which in turn hold jobs processed on this core.
     Once a container is deployed on the machine, the available time of the machine is updated accordingly.
 
+    The schedule is kept in ascending order of start times, with the start times in a separate list,
+    so that a new container is inserted by binary search and containers around a time point are found the same way.
+    Containers on the schedule should therefore be changed through the machine, to keep both lists consistent.
+    A multi-core job of a non-preemptive schedule is held by one gang container, shared by all of its machines.
+
+    Moving all containers after an index by the same time is done lazily. The shift is kept pending for the suffix
+    of the schedule, and applied to a container only once it is handed out or the pending suffix has to move.
+    Successive shifts close to each other on the schedule therefore cost only the distance between them.
+
     There are additional methods to access the schedule as a string of job ids as well as to print these details.
     """
 
+    __slots__ = ('__machine_id', '__schedule', '__start_times', '__ordered', '__shift_index', '__shift',
+                 '__available_time')
+
     def __init__(self, machine_id):
         self.__machine_id = machine_id
         self.__schedule = []
+        self.__start_times = []
+        # attached containers are appended at the end, the schedule may be out of order until the next update
+        self.__ordered = True
+        # time by which the containers from the shift index onwards are yet to be moved
+        self.__shift_index = 0
+        self.__shift = 0
         self.__available_time = 0
 
+    # moves the containers before the given index by the pending shift, the rest of them stay pending
+    def __apply_shift(self, index=None):
+        index = len(self.__schedule) if index is None else index
+        if self.__shift == 0 or index <= self.__shift_index:
+            return
+        for c in range(self.__shift_index, index):
+            self.__move_container(c, self.__shift)
+        self.__shift_index = index
+        if index >= len(self.__schedule):
+            self.__shift = 0
+
+    def __move_container(self, index, shift):
+        container = self.__schedule[index]
+        container.update(container.get_start_time() + shift, container.get_end_time() + shift, container.get_type())
+        self.__start_times[index] += shift
+
+    # binary search over the start times of the containers, including the pending shift
+    def __search_start_time(self, time, search=bisect.bisect_left):
+        if self.__shift == 0:
+            return search(self.__start_times, time)
+        index = search(self.__start_times, time, 0, self.__shift_index)
+        if index == self.__shift_index:
+            index = search(self.__start_times, time - self.__shift, index)
+        return index
+
     def update(self, container, completion_time):
-        self.__schedule.append(container)
-        self.sort_containers_ascending_start_time()
+        if self.__ordered:
+            # containers with equal start times stay in the order in which they are added
+            index = self.__search_start_time(container.get_start_time(), bisect.bisect_right)
+            self.__apply_shift(index)
+            self.__schedule.insert(index, container)
+            self.__start_times.insert(index, container.get_start_time())
+            if self.__shift != 0:
+                self.__shift_index += 1
+        else:
+            # the pending shift belongs to the containers already on the schedule, not to the new one
+            self.__apply_shift()
+            self.__schedule.append(container)
+            self.sort_containers_ascending_start_time()
         self.__available_time = completion_time
 
     def attach(self, container):
+        self.__apply_shift()
+        if self.__schedule and container.get_start_time() < self.__start_times[-1]:
+            self.__ordered = False
         self.__schedule.append(container)
+        self.__start_times.append(container.get_start_time())
+
+    # updates the container at the given index of the schedule, its start time must keep the schedule in order
+    def update_container(self, index, start_time, end_time, container_type):
+        self.__apply_shift(index + 1)
+        self.__schedule[index].update(start_time, end_time, container_type)
+        self.__start_times[index] = start_time
+
+    # moves all containers from the given index onwards by the same time
+    def shift_containers(self, index, shift):
+        if index >= len(self.__schedule):
+            return
+        if self.__shift == 0:
+            self.__shift_index = index
+        elif index > self.__shift_index:
+            self.__apply_shift(index)
+        else:
+            # containers in front of the pending suffix are moved right away
+            for c in range(index, self.__shift_index):
+                self.__move_container(c, shift)
+        self.__shift += shift
+
+    # the copy keeps the pending shift, gang containers are shared as they are never changed on a single machine
+    def clone(self):
+        machine = Machine(self.__machine_id)
+        machine.__schedule = [container.clone() if isinstance(container, Container) else container
+                              for container in self.__schedule]
+        machine.__start_times = self.__start_times.copy()
+        machine.__ordered = self.__ordered
+        machine.__shift_index = self.__shift_index
+        machine.__shift = self.__shift
+        machine.__available_time = self.__available_time
+        return machine
 
     def get_machine_id(self):
         return self.__machine_id
@@ -173,40 +690,272 @@ class Machine:
         return self.__available_time
 
     def get_scheduled_containers(self):
+        self.__apply_shift()
         return self.__schedule
 
+    def get_container_num(self):
+        return len(self.__schedule)
+
+    def get_container(self, index):
+        self.__apply_shift(index + 1)
+        return self.__schedule[index]
+
+    # times of the container at the given index, without applying the pending shift to it
+    def get_container_start_time(self, index):
+        return self.__start_times[index] + (self.__shift if index >= self.__shift_index else 0)
+
+    def get_container_end_time(self, index):
+        return self.__schedule[index].get_end_time() + (self.__shift if index >= self.__shift_index else 0)
+
+    # index of the first container which is processed at or after the reference time
+    # it is the container running at that time, if any, else the next container starting after it
+    # returns None, if all containers are completed by the reference time
     def get_container_index(self, reference_time):
-        c_start = 0
-        c_end = len(self.__schedule) - 1
-        while True:
-            c_mid = int((c_start + c_end) / 2)
-            if c_mid == c_start == c_end:
-                if self.__schedule[-1].get_end_time() <= reference_time:
-                    return None
-                else:
-                    return c_mid
-
-            start_time = self.__schedule[c_mid].get_start_time()
-            end_time = self.__schedule[c_mid].get_end_time()
-            if start_time > reference_time:
-                c_end = c_mid - 1
-            if end_time <= reference_time:
-                c_start = c_mid + 1
-            if start_time == reference_time or start_time <= reference_time < end_time:
-                return c_mid
+        if not self.__ordered:
+            self.sort_containers_ascending_start_time()
+        index = self.__search_start_time(reference_time)
+        if index > 0 and self.get_container_end_time(index - 1) > reference_time:
+            return index - 1
+        if index < len(self.__schedule):
+            return index
+        return None
+
+    # range of indices of the containers processed at or after start time, which start no later than latest start time
+    def get_container_range(self, start_time, latest_start_time):
+        first = self.get_container_index(start_time)
+        if first is None:
+            return range(0)
+        return range(first, max(first, self.__search_start_time(latest_start_time, bisect.bisect_right)))
 
     def sort_containers_ascending_start_time(self):
+        self.__apply_shift()
         if len(self.__schedule) > 0:
             self.__schedule.sort(key=lambda c: c.get_start_time(), reverse=False)
+        self.__start_times = [container.get_start_time() for container in self.__schedule]
+        self.__ordered = True
 
     def get_schedule(self):
         schedule = 'Machine ' + str(self.__machine_id) + ':'
-        self.__schedule.sort(key=lambda c: c.get_end_time())
-        for container in self.__schedule:
-            if container.get_job() is not None:
-                schedule += container.get_job().get_job_id() + ' '
+        for container in sorted(self.get_scheduled_containers(), key=lambda c: c.get_end_time()):
+            if container.get_job_id() is not None:
+                schedule += container.get_job_id() + ' '
         return schedule
 
     def print_schedule(self):
         print(self.get_schedule())
 
+
+class MachinePool:
+    """
+    Machine pool holds all machines of a simulation ordered by their available time, most loaded machine first.
+    Position 0 is the most loaded machine and position m - 1 the least loaded one, as with a sorted machine list.
+
+    Available times are kept in a numpy array next to the order of the machines, so that queries on the order
+    are binary searches instead of a sort of all machines.
+    A multi-core job occupies a window of c consecutive machines, which is updated to one available time at once.
+    Updated machines keep their position until the pool is sorted again. Sorting moves only the updated machines,
+    with the same result as a stable sort of the machine list in descending order of available time.
+    """
+
+    def __init__(self, machines):
+        self.__machines = machines
+        self.__machine_index = {machine.get_machine_id(): index for index, machine in enumerate(machines)}
+        self.__machine_ids = np.array([machine.get_machine_id() for machine in machines], dtype=np.int64)
+        # available time at each position, negated so that the array is in ascending order
+        negative_times = np.array([-machine.get_available_time() for machine in machines], dtype=np.int64)
+        # machine at each position, as an index of the machines list
+        self.__order = np.argsort(negative_times, kind='stable')
+        self.__negative_times = negative_times[self.__order]
+        # windows of machines which are updated since the pool was last sorted, as (start, end) positions
+        self.__updated_windows = []
+
+    def __len__(self):
+        return len(self.__machines)
+
+    def get_machine(self, position):
+        return self.__machines[self.__order[position]]
+
+    def get_machine_by_id(self, machine_id):
+        return self.__machines[self.__machine_index[machine_id]]
+
+    def get_machines(self):
+        return [self.__machines[index] for index in self.__order]
+
+    # ids of count machines from position start onwards
+    def get_machine_ids(self, start, count):
+        return self.__machine_ids[self.__order[start:start + count]]
+
+    def get_available_time(self, position):
+        return -int(self.__negative_times[position])
+
+    # available times of count machines from position start onwards, all machines by default
+    def get_available_times(self, start=0, count=None):
+        end = len(self.__machines) if count is None else start + count
+        return -self.__negative_times[start:end]
+
+    # available times with the number of machines for each, every machine is a group of its own
+    # only the count most loaded machines are included, if count is given
+    def get_groups(self, count=None):
+        count = len(self.__machines) if count is None else count
+        return self.get_available_times(0, count), np.ones(count, dtype=np.int64)
+
+    # position of the most loaded machine which is available at latest_time, m if there is no such machine
+    def search_loaded(self, latest_time):
+        return int(np.searchsorted(self.__negative_times, -latest_time, side='left'))
+
+    # start position of the most loaded window of count machines which are all available at latest_time
+    # returns None, if not even the count least loaded machines are available by then
+    def search_window(self, count, latest_time):
+        start = self.search_loaded(latest_time)
+        if start > len(self.__machines) - count:
+            return None
+        return start
+
+    def update(self, position, container, completion_time):
+        self.update_window(position, [container], completion_time)
+
+    # assigns one container to each machine of the window starting at position start
+    # all machines of the window become available at the same completion time
+    def update_window(self, start, containers, completion_time):
+        for position, container in enumerate(containers, start):
+            self.__machines[self.__order[position]].update(container, completion_time)
+        self.__negative_times[start:start + len(containers)] = -completion_time
+        self.__updated_windows.append((start, start + len(containers)))
+
+    # assigns one gang container to all machines of the window starting at position start
+    def update_gang(self, start, gang, completion_time):
+        for position in range(start, start + gang.get_core_num()):
+            self.__machines[self.__order[position]].update(gang, completion_time)
+        self.__negative_times[start:start + gang.get_core_num()] = -completion_time
+        self.__updated_windows.append((start, start + gang.get_core_num()))
+
+    def sort(self):
+        if len(self.__updated_windows) <= 0:
+            return
+        windows = set(self.__updated_windows)
+        self.__updated_windows = []
+        # in general, simply sort all machines again
+        if len(windows) > 1:
+            order = np.argsort(self.__negative_times, kind='stable')
+            self.__negative_times = self.__negative_times[order]
+            self.__order = self.__order[order]
+            return
+
+        # usually a single window of machines is updated to the same available time
+        # such a window moves as a block behind all machines which are loaded as much or more
+        # machines before the window with equal available time stay before, those after the window stay after
+        start, end = windows.pop()
+        count = end - start
+        negative_time = self.__negative_times[start]
+        target = int(np.searchsorted(self.__negative_times[:start], negative_time, side='right'))
+        target += int(np.searchsorted(self.__negative_times[end:], negative_time, side='left'))
+        if target == start:
+            return
+        window_order = self.__order[start:end].copy()
+        if target < start:
+            self.__negative_times[target + count:end] = self.__negative_times[target:start]
+            self.__order[target + count:end] = self.__order[target:start]
+        else:
+            self.__negative_times[start:target] = self.__negative_times[end:target + count]
+            self.__order[start:target] = self.__order[end:target + count]
+        self.__negative_times[target:target + count] = negative_time
+        self.__order[target:target + count] = window_order
+
+
+class MachineGroups:
+    """
+    Machine groups are a compressed alternative to the machine pool, for identical machines.
+    Instead of m machines, only the distinct available times are stored together with the number of machines
+    available at each time, most loaded group first. Positions are counted over all machines as in the pool.
+
+    Individual machines are not kept, so no containers or schedules exist in this mode.
+    It serves algorithms which only need the available times, such as greedy balanced, greedy best fit
+    and threshold, and both memory and time per job depend on the number of distinct available times.
+    """
+
+    def __init__(self, machine_num, available_time=0):
+        self.__machine_num = machine_num
+        # distinct available times, negated so that the list is in ascending order
+        self.__negative_times = [-available_time] if machine_num > 0 else []
+        # number of machines with each available time
+        self.__counts = [machine_num] if machine_num > 0 else []
+
+    def __len__(self):
+        return self.__machine_num
+
+    def get_machines(self):
+        return []
+
+    # group index holding the machine at the given position and the position where that group starts
+    def __locate(self, position):
+        group_start = 0
+        for group, count in enumerate(self.__counts):
+            if position < group_start + count:
+                return group, group_start
+            group_start += count
+        raise IndexError('machine position out of range')
+
+    def get_available_time(self, position):
+        group, _ = self.__locate(position)
+        return -self.__negative_times[group]
+
+    # available times of count machines from position start onwards, all machines by default
+    def get_available_times(self, start=0, count=None):
+        end = self.__machine_num if count is None else start + count
+        times, counts = self.get_groups()
+        return np.repeat(times, counts)[start:end]
+
+    # distinct available times with the number of machines for each
+    # only the count most loaded machines are included, if count is given
+    def get_groups(self, count=None):
+        times = -np.array(self.__negative_times, dtype=np.int64)
+        counts = np.array(self.__counts, dtype=np.int64)
+        if count is None:
+            return times, counts
+        group_num = int(np.searchsorted(np.cumsum(counts), count, side='left')) + 1 if count > 0 else 0
+        times, counts = times[:group_num], counts[:group_num]
+        if group_num > 0:
+            counts[-1] -= np.sum(counts) - count
+        return times, counts
+
+    # position of the most loaded machine which is available at latest_time, m if there is no such machine
+    def search_loaded(self, latest_time):
+        group = bisect.bisect_left(self.__negative_times, -latest_time)
+        return sum(self.__counts[:group])
+
+    # start position of the most loaded window of count machines which are all available at latest_time
+    # returns None, if not even the count least loaded machines are available by then
+    def search_window(self, count, latest_time):
+        start = self.search_loaded(latest_time)
+        if start > self.__machine_num - count:
+            return None
+        return start
+
+    # moves the count machines from position start onwards to the group of the completion time
+    def update_window(self, start, count, completion_time):
+        group, group_start = self.__locate(start)
+        remaining = count
+        while remaining > 0:
+            taken = min(remaining, group_start + self.__counts[group] - start)
+            self.__counts[group] -= taken
+            remaining -= taken
+            start += taken
+            group_start += self.__counts[group] + taken
+            group += 1
+
+        # groups left without machines are dropped
+        groups = [(negative_time, machine_count) for negative_time, machine_count
+                  in zip(self.__negative_times, self.__counts) if machine_count > 0]
+        self.__negative_times = [negative_time for negative_time, _ in groups]
+        self.__counts = [machine_count for _, machine_count in groups]
+
+        group = bisect.bisect_left(self.__negative_times, -completion_time)
+        if group < len(self.__negative_times) and self.__negative_times[group] == -completion_time:
+            self.__counts[group] += count
+        else:
+            self.__negative_times.insert(group, -completion_time)
+            self.__counts.insert(group, count)
+
+    # groups are always kept in order
+    def sort(self):
+        pass
@@ -14,6 +14,7 @@ SLACK_FOLDER = {'JV': SOURCE_FOLDER_PATH + 'lognormalslacks/JAVA/',
 STATISTICAL_TRACE_FOLDER = PROJECT_FOLDER_PATH + 'statisticaltraces/'
 RESULT_FOLDER = PROJECT_FOLDER_PATH + 'results/'
 LOG_FOLDER = PROJECT_FOLDER_PATH + 'log/'
+CACHE_FOLDER = PROJECT_FOLDER_PATH + 'cache/'
 
 TEST_DATA = PROJECT_FOLDER_PATH + 'testcode/jobs.txt'
 # -----------------------------------------------------------------------------------------
@@ -1,4 +1,5 @@
 import os
+from code.functions import Operations
 from lido.simulation import Scheduler
 from multiprocessing import Pool
 from lido.lidosettings import Lido
@@ -16,6 +17,8 @@ def _run_simulation():
     # this is to check whether all results can be obtained within a single run
     parameters_batch = lido.test(trace_id, core, slack_set, set_num, 16)
 
+    Operations.ingest_traces(trace_id, [parameters[0] for parameters in parameters_batch[pool_id]])
+
     scheduler = Scheduler()
     pool = Pool()
     pool.starmap(scheduler.run_specific_day, parameters_batch[pool_id])
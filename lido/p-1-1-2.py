@@ -1,5 +1,4 @@
 import os
-import copy
 
 from code.functions import Operations
 from lido.simulation import Scheduler
@@ -21,15 +20,12 @@ def _run_single_day():
     trace_file = '/home/nileshwar-gk/Projects/simulation-py/statisticaltraces/runningtrace/' \
                  'GoogleTrace2019AD2L60M0.1SD0.033C1S1.txt'
     operation = Operations()
-    jobs_master = operation.get_jobs(trace_file)
-    machine_master = operation.get_machines(1)
-    jobs = copy.deepcopy(jobs_master)
-    machines = copy.deepcopy(machine_master)
+    jobs = operation.get_jobs(trace_file)
+    machines = operation.get_machines(1)
     alg_oss = AlgorithmOSScheduling(jobs, machines, slack)
     res_oss = alg_oss.execute()
 
-    jobs = copy.deepcopy(jobs_master)
-    machines = copy.deepcopy(machine_master)
+    machines = operation.get_machines(1)
     alg_reg = AlgorithmRegion(jobs, machines, slack)
     res_reg = alg_reg.execute()
 
@@ -53,6 +49,8 @@ def _run_simulation():
 
     # print("Starting for pool {}, with total occupied cores {}".format(pool_id, len(parameters_batch[pool_id])))
 
+    Operations.ingest_traces(trace_id, [parameters[0] for parameters in parameters_batch[pool_id]])
+
     scheduler = Scheduler()
     pool = Pool()
     pool.starmap(scheduler.run_specific_day_preemption, parameters_batch[pool_id])
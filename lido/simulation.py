@@ -1,10 +1,13 @@
 import math
-import copy
+import os
 import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from code.functions import Operations
 from code.algorithms import AlgorithmGBalanced, AlgorithmGBestFit, AlgorithmThreshold, AlgorithmGMinIdle
 from code.algorithms import AlgorithmGBalancedBF, AlgorithmGBestFitBF
 from code.algorithms import AlgorithmOSScheduling, AlgorithmRegion
+from code.algorithms import Experiment, IdlePeriodDecomposition
 from code.settings import SLACKS, SD
 from code.settings import RESULT_FOLDER
 from code.settings import MACHINE_START
@@ -24,6 +27,8 @@ class Scheduler:
         if True:
             result_file = RESULT_FOLDER + self.__operations.get_result_file_name(trace_id, day, core, num, slacks, sd)
             with open(result_file, "w") as file:
+                # algorithms are run together in a single pass, so RUN TIME is the time each algorithm spends on
+                # its own steps of that pass, not the wall clock time of a separate run
                 header = "SET; SLACK; SD; MACHINES; DENOMINATOR; "
                 header += "ACC JOBS GB; REJ JOBS GB; ACC LOAD GB; REJ LOAD GB; TOT LOAD GB; RUN TIME GB; "
                 header += "ACC JOBS GBF; REJ JOBS GBF; ACC LOAD GBF; REJ LOAD GBF; TOT LOAD GBF; RUN TIME GBF; "
@@ -36,80 +41,60 @@ class Scheduler:
                 file.write(header)
             file.close()
 
+            # statistical traces of all slacks and standard deviations only differ in the due times of the jobs
+            # they are generated in memory and simulated together, without writing and reading the trace files
+            variants = []
+            variant_settings = []
             for slack in slacks:
                 for value in sd:
 
                     standard_deviation = round(slack/value, 3)
 
-                    job_file = self.__operations.get_statistical_trace_file_location(trace_id, day, slack,
-                                                                                     standard_deviation, core, num,
-                                                                                     True)
-
-                    if job_file is None:
-                        self.__operations.generate_statistical_trace_iso(trace_jobs, trace_id, day, core,
-                                                                         slack_set, slack, standard_deviation, num)
-                        job_file = self.__operations.get_statistical_trace_file_location(trace_id, day, slack,
-                                                                                         standard_deviation, core, num,
-                                                                                         True)
-                    else:
-                        print("Waiting for 60s before staring next operation...")
-                        time.sleep(60)
-                        print("Wait completed...")
-
-                    jobs_master = self.__operations.get_jobs(job_file)
-
-                    [machine_start, machine_end, machine_increment] = self.__operations.get_machine_settings(trace_id,
-                                                                                                             day,
-                                                                                                             core)
-
-                    for machine_num in range(machine_start, machine_end+1, machine_increment):
-                        data = ""
-                        data += "{}; {}; {}; {}; {}; ".format(num, slack, standard_deviation, machine_num, value)
-
-                        machines_master = self.__operations.get_machines(machine_num)
-
-                        jobs = copy.deepcopy(jobs_master)
-                        machines = copy.deepcopy(machines_master)
-                        greedy_balanced = AlgorithmGBalanced(jobs, machines)
-                        results_gb = greedy_balanced.execute()
-                        data += "{}; {}; {}; {}; {}; {}; ".format(results_gb[0], results_gb[1], results_gb[2],
-                                                                  results_gb[3], results_gb[4], results_gb[5])
-
-                        jobs = copy.deepcopy(jobs_master)
-                        machines = copy.deepcopy(machines_master)
-                        greedy_bestfit = AlgorithmGBestFit(jobs, machines)
-                        results_gbf = greedy_bestfit.execute()
-                        data += "{}; {}; {}; {}; {}; {}; ".format(results_gbf[0], results_gbf[1], results_gbf[2],
-                                                                  results_gbf[3], results_gbf[4], results_gbf[5])
-
-                        optimal_load = max(results_gb[4], results_gbf[4])
-
-                        if core == 1:
-                            jobs = copy.deepcopy(jobs_master)
-                            machines = copy.deepcopy(machines_master)
-                            threshold = AlgorithmThreshold(jobs, machines, slack)
-                            results_th = threshold.execute()
-                            data += "{}; {}; {}; {}; {}; {}; ".format(results_th[0], results_th[1], results_th[2],
-                                                                      results_th[3], results_th[4], results_th[5])
-                            optimal_load = max(optimal_load, results_th[4])
-
-                        if core == 30 or core == 120:
-                            jobs = copy.deepcopy(jobs_master)
-                            machines = copy.deepcopy(machines_master)
-                            greedy_minidle = AlgorithmGMinIdle(jobs, machines)
-                            results_gmi = greedy_minidle.execute()
-                            data += "{}; {}; {}; {}; {}; {}; ".format(results_gmi[0], results_gmi[1], results_gmi[2],
-                                                                      results_gmi[3], results_gmi[4], results_gmi[5])
-                            optimal_load = max(optimal_load, results_gmi[4])
-
-                        data += "{}; ".format(optimal_load)
-                        print(data)
-
-                        data += "\n"
-                        with open(result_file, "a") as file:
-                            file.write(data)
-                        file.close()
-
+                    variants.append(self.__operations.get_statistical_trace_iso(trace_jobs, slack_set, slack,
+                                                                                standard_deviation, num))
+                    variant_settings.append((slack, standard_deviation, value))
+
+            [machine_start, machine_end, machine_increment] = self.__operations.get_machine_settings(trace_id,
+                                                                                                     day,
+                                                                                                     core)
+
+            machine_nums = range(machine_start, machine_end+1, machine_increment)
+
+            # all algorithms of a variant and machine number are run as a single experiment, only the results are kept
+            experiments = []
+            for jobs, (slack, standard_deviation, value) in zip(variants, variant_settings):
+                for machine_num in machine_nums:
+                    algorithms = [AlgorithmGBalanced(jobs, self.__operations.get_machine_groups(machine_num),
+                                                     metrics_only=True),
+                                  AlgorithmGBestFit(jobs, self.__operations.get_machine_groups(machine_num),
+                                                    metrics_only=True)]
+                    if core == 1:
+                        algorithms.append(AlgorithmThreshold(jobs, self.__operations.get_machine_groups(machine_num),
+                                                             slack, metrics_only=True))
+                    if core == 30 or core == 120:
+                        algorithms.append(AlgorithmGMinIdle(jobs, self.__operations.get_machine_groups(machine_num),
+                                                            metrics_only=True))
+                    experiments.append(Experiment(algorithms))
+
+            # all variants and machine numbers are simulated in a single pass over the jobs of the day
+            rows = Experiment.execute_all(experiments)
+            # results row of each variant for all machine numbers
+            rows_v = [rows[v * len(machine_nums):(v + 1) * len(machine_nums)] for v in range(len(variants))]
+
+            for v, (slack, standard_deviation, value) in enumerate(variant_settings):
+                for index, machine_num in enumerate(machine_nums):
+                    data = ""
+                    data += "{}; {}; {}; {}; {}; ".format(num, slack, standard_deviation, machine_num, value)
+
+                    # results of each algorithm followed by the optimal load
+                    for result in rows_v[v][index]:
+                        data += "{}; ".format(result)
+                    print(data)
+
+                    data += "\n"
+                    with open(result_file, "a") as file:
+                        file.write(data)
+                    file.close()
 
         self.__operations.update_parallel_log(day, core, 'end')
 
@@ -157,7 +142,7 @@ class Scheduler:
                         time.sleep(60)
                         print("Wait completed...")
 
-                    jobs_master = self.__operations.get_jobs(job_file)
+                    jobs = self.__operations.get_jobs(job_file)
 
                     [machine_start, machine_end, machine_increment] = self.__operations.get_machine_settings(trace_id,
                                                                                                              day,
@@ -167,25 +152,15 @@ class Scheduler:
                         data = ""
                         data += "{}; {}; {}; {}; {}; ".format(num, slack, standard_deviation, machine_num, value)
 
-                        machines_master = self.__operations.get_machines(machine_num)
-
-                        jobs = copy.deepcopy(jobs_master)
-                        machines = copy.deepcopy(machines_master)
-                        greedy_balanced = AlgorithmGBalancedBF(jobs, machines)
-                        results_gb = greedy_balanced.execute()
-                        data += "{}; {}; {}; {}; {}; {}; ".format(results_gb[0], results_gb[1], results_gb[2],
-                                                                  results_gb[3], results_gb[4], results_gb[5])
-
-                        jobs = copy.deepcopy(jobs_master)
-                        machines = copy.deepcopy(machines_master)
-                        greedy_bestfit = AlgorithmGBestFitBF(jobs, machines)
-                        results_gbf = greedy_bestfit.execute()
-                        data += "{}; {}; {}; {}; {}; {}; ".format(results_gbf[0], results_gbf[1], results_gbf[2],
-                                                                  results_gbf[3], results_gbf[4], results_gbf[5])
-
-                        optimal_load = max(results_gb[4], results_gbf[4])
-
-                        data += "{}; ".format(optimal_load)
+                        # both backfill algorithms are run as a single experiment
+                        greedy_balanced = AlgorithmGBalancedBF(jobs, self.__operations.get_machine_groups(machine_num),
+                                                               metrics_only=True)
+                        greedy_bestfit = AlgorithmGBestFitBF(jobs, self.__operations.get_machine_groups(machine_num),
+                                                             metrics_only=True)
+                        experiment = Experiment([greedy_balanced, greedy_bestfit])
+                        # results of each algorithm followed by the optimal load
+                        for result in experiment.execute():
+                            data += "{}; ".format(result)
                         print(data)
 
                         data += "\n"
@@ -235,7 +210,7 @@ class Scheduler:
                         time.sleep(1)
                         print("Wait completed...")
 
-                    jobs_master = self.__operations.get_jobs(job_file)
+                    jobs = self.__operations.get_jobs(job_file)
 
                     [machine_start, machine_end, machine_increment] = self.__operations.get_machine_settings(trace_id,
                                                                                                              day,
@@ -245,17 +220,13 @@ class Scheduler:
                         data = ""
                         data += "{}; {}; {}; {}; {}; ".format(num, slack, standard_deviation, machine_num, value)
 
-                        machines_master = self.__operations.get_machines(machine_num)
-
-                        jobs = copy.deepcopy(jobs_master)
-                        machines = copy.deepcopy(machines_master)
+                        machines = self.__operations.get_machines(machine_num)
                         alg_oss = AlgorithmOSScheduling(jobs, machines, slack)
                         results_oss = alg_oss.execute()
                         data += "{}; {}; {}; {}; {}; {}; ".format(results_oss[0], results_oss[1], results_oss[2],
                                                                   results_oss[3], results_oss[4], results_oss[5])
 
-                        jobs = copy.deepcopy(jobs_master)
-                        machines = copy.deepcopy(machines_master)
+                        machines = self.__operations.get_machines(machine_num)
                         alg_region = AlgorithmRegion(jobs, machines, slack)
                         results_reg = alg_region.execute()
                         data += "{}; {}; {}; {}; {}; {}; ".format(results_reg[0], results_reg[1], results_reg[2],
@@ -295,9 +266,7 @@ class Scheduler:
 
         trace_jobs = self.__operations.read_jobs_iso(trace_id, day, core)
 
-        total_load = 0
-        for job in trace_jobs:
-            total_load += job.get_processing_time() * job.get_job_core()
+        total_load = int(np.sum(trace_jobs.get_processing_times().astype(np.int64) * trace_jobs.get_job_cores()))
 
         print("Started for day {}.".format(day))
         if details:
@@ -310,44 +279,46 @@ class Scheduler:
             job_file = self.__operations.get_statistical_trace_file_location(trace_id, day, slack, standard_deviation,
                                                                              core, num, True)
 
-            jobs_master = self.__operations.get_jobs(job_file)
+            jobs = self.__operations.get_jobs(job_file)
 
             start_idx = 0
             end_idx = len(machines_n) - 1
 
             counter = 0
 
-            while start_idx != end_idx:
-                mid_idx = math.ceil((start_idx + end_idx) / 2)
-                machine = machines_n[int(mid_idx)]
-
-                jobs = copy.deepcopy(jobs_master)
-                machines = self.__operations.get_machines(machine)
-
-                greedybestfit= AlgorithmGBalanced(jobs, machines)
-                [accepted_jobs, rejected_jobs, accepted_load,
-                 rejected_load, optimal_load, execution_time] = greedybestfit.execute()
-                '''
-                print("Start {} End {} Mid {}".format(start_idx, end_idx, mid_idx))
-
-                print("Accepted {} Total {} Machines {} STATUS : {}".format(accepted_load,
-                                                                            total_load,
-                                                                            machine,
-                                                                            accepted_load == total_load))
-                '''
-                if accepted_load + rejected_load == optimal_load:
-                    end_idx = mid_idx
-                elif accepted_load + rejected_load > optimal_load:
-                    start_idx = mid_idx
-
-                if end_idx == start_idx + 1:
-                    counter += 1
-
-                if counter == 2:
-                    break
+            # the idle periods of the day are split over the workers of one process pool, which serves all probes
+            # of the search, unless this runs in a worker of a pool itself, then the day is simulated as a whole
+            worker_num = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=worker_num) as executor:
+                while start_idx != end_idx:
+                    mid_idx = math.ceil((start_idx + end_idx) / 2)
+                    machine = machines_n[int(mid_idx)]
+
+                    greedybestfit = IdlePeriodDecomposition(AlgorithmGBalanced, jobs, machine, worker_num=worker_num,
+                                                            executor=executor)
+                    [accepted_jobs, rejected_jobs, accepted_load,
+                     rejected_load, optimal_load, execution_time] = greedybestfit.execute()
+                    '''
+                    print("Start {} End {} Mid {}".format(start_idx, end_idx, mid_idx))
+
+                    print("Accepted {} Total {} Machines {} STATUS : {}".format(accepted_load,
+                                                                                total_load,
+                                                                                machine,
+                                                                                accepted_load == total_load))
+                    '''
+                    if accepted_load + rejected_load == optimal_load:
+                        end_idx = mid_idx
+                    elif accepted_load + rejected_load > optimal_load:
+                        start_idx = mid_idx
+
+                    if end_idx == start_idx + 1:
+                        counter += 1
+
+                    if counter == 2:
+                        break
 
             with open(result_file, "a") as file:
-                data = "{} : {} : {}\n".format(day, len(jobs_master), machines_n[end_idx])
+                data = "{} : {} : {}\n".format(day, len(jobs), machines_n[end_idx])
                 file.write(data)
                 print("Completed for day {}.".format(day))
             file.close()
@@ -356,9 +327,7 @@ class Scheduler:
         details = True
         trace_jobs = self.__operations.read_jobs_iso(trace_id, day, core)
 
-        total_load = 0
-        for job in trace_jobs:
-            total_load += job.get_processing_time() * job.get_job_core()
+        total_load = int(np.sum(trace_jobs.get_processing_times().astype(np.int64) * trace_jobs.get_job_cores()))
 
         print("Started for day {}.".format(day))
         if details:
@@ -371,12 +340,10 @@ class Scheduler:
             job_file = self.__operations.get_statistical_trace_file_location(trace_id, day, slack, standard_deviation,
                                                                              core, num, True)
 
-            jobs_master = self.__operations.get_jobs(job_file)
-
-            jobs = copy.deepcopy(jobs_master)
-            machines = self.__operations.get_machines(machine_num)
+            jobs = self.__operations.get_jobs(job_file)
 
-            greedybalanced = AlgorithmGBalanced(jobs, machines)
+            # the idle periods of the day are split over one worker per cpu, unless this runs in a worker of a pool
+            greedybalanced = IdlePeriodDecomposition(AlgorithmGBalanced, jobs, machine_num, worker_num=os.cpu_count())
             [accepted_jobs, rejected_jobs, accepted_load,
              rejected_load, optimal_load, execution_time] = greedybalanced.execute()
 
@@ -0,0 +1,56 @@
+import numpy as np
+
+from code.schedulingelements import Container, GangContainer, Job, Machine
+
+
+def get_containers(machine):
+    return [[c.get_start_time(), c.get_end_time(), c.get_job_id()] for c in machine.get_scheduled_containers()]
+
+
+def new_container(container_id, start_time, end_time):
+    container = Container(container_id)
+    container.assign(str(container_id), start_time, end_time, 1)
+    return container
+
+
+def test_job_clone_is_independent():
+    job = Job('1', 10, 0, 20, 1)
+    job.update(0, 10, 1)
+    clone = job.clone()
+    assert clone.get_details() == job.get_details()
+    clone.update(5, 15, 0)
+    assert job.get_details() == '1 with 1 cores: p_j = 10, r_j = 0, d_j = 20, start = 0, end = 10, weight = 1'
+    assert clone.get_weight() == 0
+
+
+def test_container_clone_is_independent():
+    container = new_container(1, 0, 10)
+    clone = container.clone()
+    assert clone.get_details() == container.get_details()
+    clone.update(5, 15, 1)
+    assert (container.get_start_time(), container.get_end_time(), container.get_type()) == (0, 10, 0)
+
+
+def test_machine_clone_keeps_pending_shift_and_is_independent():
+    machine = Machine(1)
+    gang = GangContainer(1, 2)
+    gang.assign('1', 0, 10, np.array([1, 2]))
+    machine.update(gang, 10)
+    for container_id, start_time in enumerate((10, 20, 30), 2):
+        machine.update(new_container(container_id, start_time, start_time + 10), start_time + 10)
+    # the containers from index 2 onwards are yet to be moved, when the machine is cloned
+    machine.shift_containers(2, 5)
+    clone = machine.clone()
+
+    clone.shift_containers(3, 3)
+    clone.update_container(1, 10, 14, 1)
+    clone.update(new_container(5, 60, 70), 70)
+    assert get_containers(clone) == [[0, 10, '1'], [10, 14, '2'], [25, 35, '3'], [38, 48, '4'], [60, 70, '5']]
+    assert clone.get_available_time() == 70
+
+    assert get_containers(machine) == [[0, 10, '1'], [10, 20, '2'], [25, 35, '3'], [35, 45, '4']]
+    assert machine.get_available_time() == 40
+    assert machine.get_container(1).get_type() == 0
+    # gang containers are shared, per-core containers are copied
+    assert clone.get_container(0) is gang
+    assert clone.get_container(1) is not machine.get_container(1)
@@ -0,0 +1,19 @@
+import random
+
+import pytest
+
+from code.schedulingelements import CumulativeLoad
+
+
+# the load is compared with the sum over all added jobs, min(max(t - a, 0), p) for a job started at a with length p
+@pytest.mark.parametrize('seed', range(40))
+def test_cumulative_load_matches_direct_sum(seed):
+    rnd = random.Random(seed)
+    jobs = [(rnd.randrange(0, 100), rnd.randrange(0, 30)) for _ in range(rnd.randrange(1, 50))]
+    load = CumulativeLoad([time for start_time, length in jobs for time in (start_time, start_time + length)])
+    added = []
+    for start_time, length in jobs:
+        load.add(start_time, length)
+        added.append((start_time, length))
+        time = rnd.randrange(-10, 140)
+        assert load.get_load(time) == sum(min(max(time - a, 0), p) for a, p in added)
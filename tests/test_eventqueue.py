@@ -0,0 +1,34 @@
+from code.schedulingelements import EventQueue, JobStream
+
+
+def new_event_queue(handled):
+    # jobs 0, 1 and 2 are released at times 5, 10 and 10, in the order of the job stream
+    events = EventQueue(JobStream([2, 0, 1]), [10, 10, 5])
+    for event_type in (EventQueue.COMPLETION, EventQueue.HOLE_EXPIRY, EventQueue.RELEASE):
+        events.subscribe(event_type, lambda item, event_type=event_type: handled.append((event_type, item)))
+    return events
+
+
+def test_events_are_merged_with_releases_in_order_of_time_and_type():
+    handled = []
+    events = new_event_queue(handled)
+    events.add(10, EventQueue.RELEASE + 1, 'ignored')
+    events.add(10, EventQueue.HOLE_EXPIRY, 'hole')
+    events.add(10, EventQueue.COMPLETION, 'first')
+    events.add(10, EventQueue.COMPLETION, 'second')
+    events.add(12, EventQueue.COMPLETION, 'last')
+    assert len(events) == 7
+    events.dispatch(10)
+    assert handled == [(EventQueue.RELEASE, 2), (EventQueue.COMPLETION, 'first'), (EventQueue.COMPLETION, 'second'),
+                       (EventQueue.HOLE_EXPIRY, 'hole'), (EventQueue.RELEASE, 0), (EventQueue.RELEASE, 1)]
+    assert events.get_next_time() == 12
+    events.dispatch()
+    assert handled[-1] == (EventQueue.COMPLETION, 'last')
+    assert len(events) == 0 and events.get_next_time() is None
+
+
+def test_events_without_subscriber_are_dropped():
+    events = EventQueue(JobStream([0]), [0])
+    events.add(0, EventQueue.COMPLETION, 'job')
+    events.add(0, EventQueue.HOLE_EXPIRY, 'hole')
+    assert len(events) == 1
@@ -0,0 +1,35 @@
+import code.functions as functions
+from code.functions import Operations
+
+
+def write_raw_trace(folder, lines):
+    trace_file = folder / 'GoogleTrace2019D1.txt'
+    trace_file.write_text(''.join('\t'.join(fields) + '\n' for fields in lines))
+
+
+def test_ingest_trace_keeps_fields_with_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(functions, 'CLOUD_TRACE_FOLDER', {'2019A': str(tmp_path) + '/'})
+    monkeypatch.setattr(functions, 'CACHE_FOLDER', str(tmp_path) + '/cache/')
+    write_raw_trace(tmp_path, [['job#1', 'a', 'b', '30', 'c#d', 'e', 'f', 'g', '5', 'h', 'accept', '2'],
+                               ['job2', 'a', 'b', '40', 'c', 'e', 'f', 'g', '3', '#h', 'reject', '1'],
+                               ['job3', 'a', 'b', '50', 'c', 'e', 'f', 'g', '7', 'h', 'ACCEPT', '1']])
+    job_ids, processing_times, release_times, job_cores, accept, core_rows, row_cores = \
+        Operations.ingest_trace('2019A', 1)
+    assert job_ids.tolist() == ['job#1', 'job2', 'job3']
+    assert processing_times.tolist() == [30, 40, 50]
+    assert release_times.tolist() == [5, 3, 7]
+    assert job_cores.tolist() == [2, 1, 1]
+    assert accept.tolist() == [True, False, True]
+    assert core_rows.tolist() == [2, 0]
+    assert row_cores.tolist() == [1, 2]
+
+
+def test_get_jobs_keeps_job_ids_with_hash(tmp_path):
+    job_file = tmp_path / 'jobs.txt'
+    job_file.write_text('job#1;10;0;15;2;0.5;\njob2;20;5;30;1;0.25;\n')
+    jobs = Operations.get_jobs(str(job_file))
+    assert jobs.get_job_ids().tolist() == ['job#1', 'job2']
+    assert jobs.get_processing_times().tolist() == [10, 20]
+    assert jobs.get_release_times().tolist() == [0, 5]
+    assert jobs.get_due_times().tolist() == [15, 30]
+    assert jobs.get_job_cores().tolist() == [2, 1]
@@ -0,0 +1,55 @@
+import random
+
+import numpy as np
+import pytest
+
+from code.schedulingelements import Container, GangContainer, HoleStore
+
+
+def get_keys(holes):
+    return [(hole.get_id(), hole.get_start_time(), hole.get_end_time()) for hole in holes]
+
+
+# the store is compared with a plain list of holes, all of which are looked at for each query
+@pytest.mark.parametrize('seed', range(40))
+def test_hole_store_matches_scanned_hole_list(seed):
+    rnd = random.Random(seed)
+    store = HoleStore()
+    holes = []
+    container_id = 1
+    time = 0
+    for _ in range(rnd.randrange(1, 150)):
+        operation = rnd.random()
+        if operation < 0.4:
+            start_time = time + rnd.randrange(-5, 30)
+            end_time = start_time + rnd.randrange(1, 40)
+            core_num = rnd.choice([1, 1, 2, 5])
+            if core_num > 1:
+                hole = GangContainer(container_id, core_num)
+                hole.reserve(start_time, end_time, end_time - start_time, np.arange(1, core_num + 1))
+            else:
+                hole = Container(container_id)
+                hole.reserve(start_time, end_time, end_time - start_time, 1)
+            container_id += core_num
+            store.add(hole)
+            holes.append(hole)
+        elif operation < 0.85:
+            end_time = time + rnd.randrange(1, 40)
+            holes = [hole for hole in holes if hole.get_end_time() > time]
+            expected = sorted([hole for hole in holes if hole.get_start_time() < end_time], key=lambda c: c.get_id())
+            found = store.get_holes(time, end_time)
+            assert [hole.get_id() for hole in found] == [hole.get_id() for hole in expected]
+            for hole in found:
+                if isinstance(hole, GangContainer) and rnd.random() < 0.5:
+                    containers = store.expand(hole)
+                    index = holes.index(hole)
+                    holes[index:index + 1] = containers
+                elif rnd.random() < 0.2:
+                    store.remove(hole)
+                    holes.remove(hole)
+                    break
+        else:
+            time += rnd.randrange(0, 10)
+    # all holes left after the last lookup, with the holes of expanded gangs in place of the gang
+    holes = [hole for hole in holes if hole.get_end_time() > time]
+    assert get_keys(store.get_holes(time, time + 10 ** 9)) == get_keys(sorted(holes, key=lambda c: c.get_id()))
@@ -0,0 +1,125 @@
+import bisect
+import random
+
+import pytest
+
+from code.schedulingelements import Container, Machine
+
+
+# plain schedule of a machine, shifts are applied to every container right away
+class MachineModel:
+    def __init__(self):
+        # containers as [start time, end time, job id], in ascending order of start times
+        self.containers = []
+        self.ordered = True
+
+    def sort(self):
+        self.containers.sort(key=lambda c: c[0])
+        self.ordered = True
+
+    def update(self, start_time, end_time, job_id):
+        if self.ordered:
+            index = bisect.bisect_right([c[0] for c in self.containers], start_time)
+            self.containers.insert(index, [start_time, end_time, job_id])
+        else:
+            self.containers.append([start_time, end_time, job_id])
+            self.sort()
+
+    def attach(self, start_time, end_time, job_id):
+        if self.containers and start_time < self.containers[-1][0]:
+            self.ordered = False
+        self.containers.append([start_time, end_time, job_id])
+
+    def shift_containers(self, index, shift):
+        for container in self.containers[index:]:
+            container[0] += shift
+            container[1] += shift
+
+    def get_container_index(self, reference_time):
+        if not self.ordered:
+            self.sort()
+        index = bisect.bisect_left([c[0] for c in self.containers], reference_time)
+        if index > 0 and self.containers[index - 1][1] > reference_time:
+            return index - 1
+        if index < len(self.containers):
+            return index
+        return None
+
+    def get_container_range(self, start_time, latest_start_time):
+        first = self.get_container_index(start_time)
+        if first is None:
+            return range(0)
+        return range(first, max(first, bisect.bisect_right([c[0] for c in self.containers], latest_start_time)))
+
+
+def get_containers(machine):
+    return [[c.get_start_time(), c.get_end_time(), c.get_job_id()] for c in machine.get_scheduled_containers()]
+
+
+def new_container(step, start_time, end_time):
+    container = Container(step)
+    container.assign(str(step), start_time, end_time, 1)
+    return container
+
+
+# the machine and the model are given the same random operations, every query has to give the same answer
+@pytest.mark.parametrize('seed', range(40))
+def test_machine_matches_eagerly_shifted_schedule(seed):
+    rnd = random.Random(seed)
+    machine = Machine(1)
+    model = MachineModel()
+    time = 0
+    for step in range(rnd.randrange(1, 200)):
+        operation = rnd.random()
+        if operation < 0.35:
+            start_time = time + rnd.randrange(-20, 20) if rnd.random() < 0.3 else time + rnd.randrange(0, 10)
+            end_time = start_time + rnd.randrange(1, 30)
+            time = max(time, start_time)
+            machine.update(new_container(step, start_time, end_time), end_time)
+            model.update(start_time, end_time, str(step))
+        elif operation < 0.4:
+            start_time = time + rnd.randrange(-30, 5)
+            end_time = start_time + rnd.randrange(1, 10)
+            machine.attach(new_container(step, start_time, end_time))
+            model.attach(start_time, end_time, str(step))
+        elif operation < 0.6 and model.containers:
+            index = rnd.randrange(len(model.containers) + 1)
+            shift = rnd.randrange(1, 15)
+            machine.shift_containers(index, shift)
+            model.shift_containers(index, shift)
+        elif operation < 0.7 and model.containers:
+            # the container keeps its start time, so the schedule stays in order
+            model.get_container_index(0)
+            machine.get_container_index(0)
+            index = rnd.randrange(len(model.containers))
+            start_time = model.containers[index][0]
+            end_time = start_time + rnd.randrange(1, 30)
+            machine.update_container(index, start_time, end_time, 1)
+            model.containers[index][1] = end_time
+        elif operation < 0.85:
+            reference_time = time + rnd.randrange(-40, 40)
+            latest_start_time = reference_time + rnd.randrange(0, 40)
+            assert machine.get_container_range(reference_time, latest_start_time) == \
+                model.get_container_range(reference_time, latest_start_time)
+        elif model.containers:
+            model.get_container_index(0)
+            machine.get_container_index(0)
+            index = rnd.randrange(len(model.containers))
+            container = machine.get_container(index)
+            assert [container.get_start_time(), container.get_end_time(), container.get_job_id()] == \
+                model.containers[index]
+    model.get_container_index(0)
+    machine.get_container_index(0)
+    assert [[machine.get_container_start_time(index), machine.get_container_end_time(index)]
+            for index in range(machine.get_container_num())] == [c[:2] for c in model.containers]
+    assert get_containers(machine) == model.containers
+
+
+def test_update_of_unordered_schedule_with_pending_shift():
+    machine = Machine(1)
+    machine.update(new_container(1, 0, 10), 10)
+    machine.update(new_container(2, 10, 20), 20)
+    machine.shift_containers(1, 5)
+    machine.attach(new_container(3, 5, 8))
+    machine.update(new_container(4, 30, 40), 40)
+    assert get_containers(machine) == [[0, 10, '1'], [5, 8, '3'], [15, 25, '2'], [30, 40, '4']]
@@ -0,0 +1,36 @@
+import random
+
+import numpy as np
+import pytest
+
+from code.schedulingelements import MachineGroups
+
+
+# the groups are compared with the available times of all machines, most loaded first
+@pytest.mark.parametrize('seed', range(40))
+def test_machine_groups_match_available_times_of_all_machines(seed):
+    rnd = random.Random(seed)
+    machine_num = rnd.randrange(1, 60)
+    groups = MachineGroups(machine_num)
+    available_times = [0] * machine_num
+    time = 0
+    for _ in range(rnd.randrange(1, 100)):
+        count = rnd.randrange(1, machine_num + 1)
+        start = rnd.randrange(0, machine_num - count + 1)
+        completion_time = time + rnd.choice([0, rnd.randrange(0, 50)])
+        groups.update_window(start, count, completion_time)
+        available_times[start:start + count] = [completion_time] * count
+        available_times.sort(reverse=True)
+        assert groups.get_available_times().tolist() == available_times
+        position = rnd.randrange(machine_num)
+        assert groups.get_available_time(position) == available_times[position]
+        latest_time = time + rnd.randrange(-10, 60)
+        loaded = next((position for position, available_time in enumerate(available_times)
+                       if available_time <= latest_time), machine_num)
+        assert groups.search_loaded(latest_time) == loaded
+        assert groups.search_window(count, latest_time) == (loaded if loaded <= machine_num - count else None)
+        group_times, group_counts = groups.get_groups()
+        assert np.repeat(group_times, group_counts).tolist() == available_times
+        group_times, group_counts = groups.get_groups(count)
+        assert np.repeat(group_times, group_counts).tolist() == available_times[:count]
+        time += rnd.randrange(0, 10)
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from code.schedulingelements import Container, Machine, MachinePool
+
+
+# the pool is compared with a plain list of machine ids, which is sorted again as a whole after each step
+@pytest.mark.parametrize('seed', range(40))
+def test_machine_pool_matches_sorted_machine_list(seed):
+    rnd = random.Random(seed)
+    machine_num = rnd.randrange(1, 40)
+    pool = MachinePool([Machine(m) for m in range(1, machine_num + 1)])
+    order = list(range(1, machine_num + 1))
+    available_times = {m: 0 for m in order}
+    time = 0
+    for step in range(rnd.randrange(1, 100)):
+        for _ in range(rnd.choice([1, 1, 1, 2, 3])):
+            count = rnd.randrange(1, machine_num + 1)
+            start = rnd.randrange(0, machine_num - count + 1)
+            completion_time = time + rnd.choice([0, rnd.randrange(0, 50)])
+            containers = []
+            for position in range(start, start + count):
+                container = Container(step)
+                container.assign(str(step), time, completion_time, order[position])
+                containers.append(container)
+                available_times[order[position]] = completion_time
+            pool.update_window(start, containers, completion_time)
+        pool.sort()
+        order.sort(key=lambda m: available_times[m], reverse=True)
+        assert [machine.get_machine_id() for machine in pool.get_machines()] == order
+        assert pool.get_available_times().tolist() == [available_times[m] for m in order]
+        latest_time = time + rnd.randrange(-10, 60)
+        loaded = next((position for position, m in enumerate(order) if available_times[m] <= latest_time),
+                      machine_num)
+        assert pool.search_loaded(latest_time) == loaded
+        time += rnd.randrange(0, 10)
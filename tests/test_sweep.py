@@ -0,0 +1,25 @@
+import pytest
+
+from code.algorithms import AlgorithmGBalanced, Sweep
+from code.functions import Operations
+from code.schedulingelements import JobTable
+
+
+def new_job_table(release_times):
+    return JobTable(['1', '2', '3'], [4, 2, 3], release_times, [6, 5, 9], [1, 1, 1])
+
+
+def test_sweep_matches_separate_runs_of_tables_with_other_due_times():
+    jobs = new_job_table([0, 1, 1])
+    variants = [jobs, jobs.with_due_times([4, 3, 4]), jobs.with_due_times([10, 10, 10])]
+    results = Sweep([AlgorithmGBalanced(variant, Operations.get_machine_groups(1), metrics_only=True)
+                     for variant in variants]).execute()
+    for variant, result in zip(variants, results):
+        expected = AlgorithmGBalanced(variant, Operations.get_machine_groups(1), metrics_only=True).execute()
+        assert result[:5] == expected[:5]
+
+
+def test_sweep_rejects_other_release_times():
+    with pytest.raises(ValueError):
+        Sweep([AlgorithmGBalanced(new_job_table([0, 1, 1]), Operations.get_machine_groups(1)),
+               AlgorithmGBalanced(new_job_table([0, 2, 1]), Operations.get_machine_groups(1))])